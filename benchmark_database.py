@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Query benchmark for the MapLeads database
+Times the dashboard queries and the exists/insert path against synthetic
+databases of increasing size, after checking that scan checkpoints do not
+pile up over repeated cycles
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from generate_test_data import generate_businesses, populate_database, synthetic_phone
+from src.database import COMPLETED_SCAN_CYCLES_KEPT, Database
+
+DEFAULT_SIZES = '100000,1000000,5000000'
+
+# Miss lookups use row numbers far past anything the generator has produced
+MISSING_PHONE_OFFSET = 10 ** 9
+
+def time_call(func, repeat):
+    """Run func `repeat` times, returning per-call milliseconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+def summarize(timings):
+    ordered = sorted(timings)
+    return {
+        'median_ms': round(statistics.median(ordered), 3),
+        'p95_ms': round(ordered[min(int(round(0.95 * (len(ordered) - 1))), len(ordered) - 1)], 3),
+        'min_ms': round(ordered[0], 3),
+    }
+
+def prepare_database(path: Path, rows: int, seed: int) -> Database:
+    """Open (or grow) a cached synthetic database to at least `rows` businesses"""
+    db = Database(str(path))
+    with db._connection() as conn:
+        existing = conn.execute("SELECT COUNT(*) FROM businesses WHERE source_url = 'synthetic'").fetchone()[0]
+
+    if existing < rows:
+        print(f"🏗️  Generating {rows - existing:,} businesses for the {rows:,} row database")
+        start = time.perf_counter()
+        populate_database(db, rows - existing, seed=seed, progress=True)
+        with db._connection() as conn:
+            conn.execute('ANALYZE')
+        print(f"   Generated in {time.perf_counter() - start:.1f}s")
+    return db
+
+def check_scan_checkpoints(cycles: int = 200, locations: int = 50) -> bool:
+    """Run many small scan cycles and check the checkpoint tables stay bounded"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(str(Path(tmp) / 'checkpoints.db'))
+        try:
+            keys = [f'{i}.00000,0.00000' for i in range(locations)]
+            for cycle in range(cycles):
+                cycle_id = db.start_scan_cycle('continuous', 'plumber', {'states': ['ST']}, keys)
+                for key in keys:
+                    db.set_scan_cycle_location_status(cycle_id, key, 'in_flight')
+                    db.set_scan_cycle_location_status(cycle_id, key, 'done')
+                db.complete_scan_cycle(cycle_id)
+            
+            # An unfinished cycle keeps its checkpoints so it can be resumed
+            open_id = db.start_scan_cycle('continuous', 'plumber', {'states': ['ST']}, keys)
+            with db._connection() as conn:
+                cycle_rows = conn.execute('SELECT COUNT(*) FROM scan_cycles').fetchone()[0]
+                location_rows = conn.execute('SELECT COUNT(*) FROM scan_cycle_locations').fetchone()[0]
+            resumable = len(db.get_scan_cycle_remaining(open_id)) == locations
+        finally:
+            db.close()
+    
+    return cycle_rows == COMPLETED_SCAN_CYCLES_KEPT + 1 and location_rows == locations and resumable
+
+def benchmark_size(db: Database, rows: int, repeat: int, seed: int):
+    """Time every query and write path against one database"""
+    rng = random.Random(seed)
+    with db._connection() as conn:
+        next_row = conn.execute('SELECT MAX(id) FROM businesses').fetchone()[0] or 0
+
+    # Rows for the write paths are generated up front so only the database is timed
+    keys = ('name', 'phone', 'category', 'address', 'city', 'state', 'zip_code',
+            'latitude', 'longitude', 'website', 'reviews', 'rating', 'source_url', 'metadata')
+    fresh = [
+        dict(zip(keys, row), source_url='benchmark')
+        for row in generate_businesses((repeat + 1) * 21, seed=seed, start=next_row + MISSING_PHONE_OFFSET)
+    ]
+
+    def new_business_rows(count):
+        return [fresh.pop() for _ in range(count)]
+
+    def existing_phone():
+        return synthetic_phone(rng.randrange(rows))
+
+    def missing_phone():
+        return synthetic_phone(MISSING_PHONE_OFFSET * 2 + rng.randrange(rows))
+
+    def upsert_page():
+        # A typical results page: half already known, half new
+        page = new_business_rows(10)
+        for business in new_business_rows(10):
+            business['phone'] = existing_phone()
+            page.append(business)
+        db.upsert_businesses(page)
+
+    # Cursor at the same depth as the deep offset, found by walking the pages once
+    deep_cursor = None
+    for _ in range(rows // 2 // 5000):
+        _, deep_cursor = db.get_businesses_page(5000, deep_cursor)
+
+    cases = {
+        'get_recent_businesses(limit=50)': lambda: db.get_recent_businesses(50),
+        'get_recent_businesses(limit=50, deep offset)': lambda: db.get_recent_businesses(50, rows // 2),
+        'get_businesses_page(limit=50)': lambda: db.get_businesses_page(50),
+        'get_businesses_page(limit=50, deep cursor)': lambda: db.get_businesses_page(50, deep_cursor),
+        'get_businesses_page(category + state)': lambda: db.get_businesses_page(50, category='Plumber', state='CA'),
+        'get_businesses_page(search)': lambda: db.get_businesses_page(50, search='golden plumb'),
+        'get_businesses_page(rating >= 4.5, by rating)': lambda: db.get_businesses_page(50, min_rating=4.5, sort='rating'),
+        'get_businesses_since_days(1)': lambda: db.get_businesses_since_days(1),
+        'get_businesses_since_days(7)': lambda: db.get_businesses_since_days(7),
+        'get_businesses_since_days(30)': lambda: db.get_businesses_since_days(30),
+        'get_statistics()': db.get_statistics,
+        'business_exists (hit)': lambda: db.business_exists(existing_phone()),
+        'business_exists (miss)': lambda: db.business_exists(missing_phone()),
+        'add_business': lambda: db.add_business(new_business_rows(1)[0]),
+        'upsert_businesses (20-card page)': upsert_page,
+    }
+
+    results = {}
+    for label, func in cases.items():
+        # Bulk reads return tens of thousands of rows at the larger sizes
+        runs = max(3, repeat // 10) if 'since_days' in label else repeat
+        func()  # warm the page cache
+        results[label] = summarize(time_call(func, runs))
+        print(f"   {label:<46} median {results[label]['median_ms']:10.3f} ms   "
+              f"p95 {results[label]['p95_ms']:10.3f} ms")
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help='Comma-separated row counts')
+    parser.add_argument('--data-dir', default='data/benchmark',
+                        help='Where the synthetic databases are kept between runs')
+    parser.add_argument('--repeat', type=int, default=50, help='Runs per query')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='Save results as JSON for regression comparison')
+    args = parser.parse_args()
+
+    data_dir = Path(args.data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    sizes = [int(value) for value in args.sizes.split(',')]
+
+    print("⏱️  MapLeads database benchmark\n")
+    if not check_scan_checkpoints():
+        print("❌ Scan checkpoint tables keep growing over repeated cycles")
+        sys.exit(1)
+    print("✅ Scan checkpoint tables stay bounded over repeated cycles")
+    results = {}
+    for rows in sizes:
+        db = prepare_database(data_dir / f'businesses_{rows}.db', rows, args.seed)
+        print(f"\n📊 {rows:,} businesses")
+        try:
+            results[str(rows)] = benchmark_size(db, rows, args.repeat, args.seed)
+        finally:
+            db.close()
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📁 Results saved to {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Import benchmark for MapLeads
+Times validation of a synthetic CRM dump with the vectorized
+validate_import_data against the original row-by-row implementation
+(checking that both produce the same rows and error report, also for the
+nullable, Arrow-backed and list-of-dicts inputs other formats produce), then loading
+the valid rows with Database.bulk_import against the per-row insert loop
+"""
+
+import argparse
+import copy
+import io
+import json
+import math
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import pandas as pd
+
+from generate_test_data import generate_businesses
+from src.database import BUSINESS_COLUMNS, Database
+from src.exporter import validate_import_data
+
+COLUMNS = [column.strip() for column in BUSINESS_COLUMNS.split(',')]
+
+def validate_import_data_rowwise(businesses):
+    """The row-at-a-time validate_import_data this benchmark compares against"""
+    required_fields = ['name', 'phone', 'category']
+    optional_fields = ['reviews', 'rating', 'website', 'city', 'state', 'zip_code', 'latitude', 'longitude']
+
+    valid_businesses = []
+    errors = []
+
+    for i, business in enumerate(businesses):
+        row_errors = []
+
+        for field in required_fields:
+            if field not in business or not business[field] or pd.isna(business[field]):
+                row_errors.append(f"Missing required field: {field}")
+
+        if 'phone' in business and business['phone']:
+            phone = str(business['phone']).strip()
+            clean_phone = ''.join(filter(str.isdigit, phone))
+            if len(clean_phone) != 10:
+                row_errors.append(f"Invalid phone number format: {phone}")
+            else:
+                business['phone'] = clean_phone
+
+        if 'rating' in business and business['rating'] and not pd.isna(business['rating']):
+            try:
+                rating = float(business['rating'])
+                if not (0 <= rating <= 5):
+                    row_errors.append(f"Rating must be between 0-5: {rating}")
+                else:
+                    business['rating'] = rating
+            except (ValueError, TypeError):
+                row_errors.append(f"Invalid rating format: {business['rating']}")
+                business['rating'] = None
+
+        for field in ['name', 'category', 'city', 'state']:
+            if field in business and business[field] and not pd.isna(business[field]):
+                business[field] = str(business[field]).strip()
+
+        for field in optional_fields:
+            if field not in business or pd.isna(business[field]):
+                business[field] = None
+
+        business['imported_at'] = datetime.now().isoformat()
+        business['source'] = 'import'
+
+        if row_errors:
+            errors.append(f"Row {i+1}: {'; '.join(row_errors)}")
+        else:
+            valid_businesses.append(business)
+
+    return valid_businesses, errors
+
+def crm_dump(rows: int, bad_fraction: float, seed: int) -> str:
+    """CSV text shaped like a CRM export: formatted phones and some broken rows"""
+    rng = random.Random(seed)
+    records = []
+    for values in generate_businesses(rows, seed=seed):
+        business = dict(zip(COLUMNS, values))
+        phone = business['phone']
+        business['phone'] = rng.choice([phone, f"({phone[:3]}) {phone[3:6]}-{phone[6:]}", f"{phone[:3]}.{phone[3:6]}.{phone[6:]}"])
+        business['name'] = rng.choice([business['name'], f"  {business['name']} "])
+        if rng.random() < bad_fraction:
+            broken = rng.choice(['name', 'phone', 'rating', 'rating_text'])
+            if broken == 'name':
+                business['name'] = ''
+            elif broken == 'phone':
+                business['phone'] = business['phone'][:-3]
+            elif broken == 'rating':
+                business['rating'] = 7
+            else:
+                business['rating'] = 'n/a'
+        records.append(business)
+
+    buffer = io.StringIO()
+    pd.DataFrame(records).to_csv(buffer, index=False)
+    return buffer.getvalue()
+
+def comparable(businesses):
+    """Rows without the per-call import timestamp, NaN made comparable"""
+    return [
+        {key: 'NaN' if isinstance(value, float) and math.isnan(value) else value
+         for key, value in business.items() if key != 'imported_at'}
+        for business in businesses
+    ]
+
+def same_results(rowwise, vectorized) -> bool:
+    return comparable(rowwise[0]) == comparable(vectorized[0]) and rowwise[1] == vectorized[1]
+
+def without_na(frame):
+    """`frame` with pd.NA turned into NaN; the row-by-row validator can't truth-test pd.NA"""
+    return frame.astype(object).where(frame.notna(), float('nan'))
+
+def equivalence_cases(frame, seed: int):
+    """(name, vectorized input, row-by-row input) for input shapes other than CSV"""
+    rng = random.Random(seed)
+    digits = pd.to_numeric(frame['phone'].str.replace(r'[^0-9]', '', regex=True), errors='coerce')
+    cases = {
+        'nullable dtypes (Parquet/Feather from pandas)': frame.convert_dtypes(),
+        'numeric Int64 phones': frame.assign(phone=digits.astype('Int64')),
+    }
+    try:
+        import pyarrow  # noqa: F401
+        strings = [column for column in frame.columns if not pd.api.types.is_numeric_dtype(frame[column])]
+        cases['string[pyarrow] columns'] = frame.astype({column: 'string[pyarrow]' for column in strings})
+    except ImportError:
+        pass
+    
+    for name, converted in cases.items():
+        yield name, converted, without_na(converted).to_dict('records')
+    
+    # JSON sources leave keys out rather than writing null
+    records = frame.to_dict('records')
+    for record in records:
+        if rng.random() < 0.05:
+            del record[rng.choice(['phone', 'rating', 'city', 'website'])]
+    yield 'dicts with missing keys', records, copy.deepcopy(records)
+
+def time_validation(name, validate, frame, rows, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = validate(frame)
+        timings.append(time.perf_counter() - start)
+    seconds = statistics.median(timings)
+    print(f"   {name:<12} {seconds * 1000:>9.1f} ms  {rows / seconds:>12,.0f} rows/s")
+    return result, {'median_s': round(seconds, 4), 'rows_per_second': round(rows / seconds)}
+
+def import_rowwise(db: Database, businesses):
+    """The per-business insert loop import_data used before bulk_import"""
+    for business in businesses:
+        if db.business_exists(business['phone']):
+            db.update_last_seen(business['phone'])
+        else:
+            db.add_business(business)
+
+def time_import(name, load, businesses):
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(str(Path(tmp) / 'import.db'))
+        try:
+            start = time.perf_counter()
+            load(db, businesses)
+            seconds = time.perf_counter() - start
+        finally:
+            db.close()
+    rows = len(businesses)
+    print(f"   {name:<12} {rows:>9,} rows {seconds:>8.1f} s  {rows / seconds:>12,.0f} rows/s")
+    return {'rows': rows, 'seconds': round(seconds, 3), 'rows_per_second': round(rows / seconds)}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=300000, help='Rows in the synthetic CRM dump')
+    parser.add_argument('--bad-fraction', type=float, default=0.05, help='Share of rows with a validation error')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per implementation')
+    parser.add_argument('--rowwise-import-rows', type=int, default=20000,
+                        help='Rows loaded with the slow per-row insert loop')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='Save results as JSON for regression comparison')
+    args = parser.parse_args()
+
+    print(f"🏗️  Generating a {args.rows:,} row CRM dump")
+    text = crm_dump(args.rows, args.bad_fraction, args.seed)
+
+    def read():
+        return pd.read_csv(io.StringIO(text))
+
+    print("\n⏱️  validate_import_data")
+    rowwise, rowwise_stats = time_validation(
+        'row-by-row', lambda frame: validate_import_data_rowwise(frame.to_dict('records')), read(), args.rows, args.repeat)
+    vectorized, vectorized_stats = time_validation(
+        'vectorized', validate_import_data, read(), args.rows, args.repeat)
+
+    if not same_results(rowwise, vectorized):
+        print("❌ Vectorized validation differs from the row-by-row results")
+        sys.exit(1)
+    print(f"\n✅ Same results: {len(vectorized[0]):,} valid rows, {len(vectorized[1]):,} errors "
+          f"({rowwise_stats['median_s'] / vectorized_stats['median_s']:.1f}x faster)")
+    
+    for name, frame, records in equivalence_cases(read(), args.seed):
+        if not same_results(validate_import_data_rowwise(records), validate_import_data(frame)):
+            print(f"❌ Vectorized validation differs from the row-by-row results on {name}")
+            sys.exit(1)
+        print(f"✅ Same results on {name}")
+
+    print("\n⏱️  Loading valid rows into an empty database")
+    businesses = vectorized[0]
+    import_stats = {
+        'rowwise': time_import('row-by-row', import_rowwise, businesses[:args.rowwise_import_rows]),
+        'bulk': time_import('bulk', lambda db, rows: db.bulk_import(rows), businesses),
+    }
+
+    if args.output:
+        results = {
+            'rows': args.rows,
+            'validation': {'rowwise': rowwise_stats, 'vectorized': vectorized_stats},
+            'import': import_stats,
+        }
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"📁 Results saved to {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for the MapLeads scraping pipeline
+Drives MapLeadsScraper over locally served synthetic result pages and a
+synthetic database, once per browser-instance count
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from html import escape
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.database import BUSINESS_COLUMNS, BUSINESS_PLACEHOLDERS, Database
+from src.db_writer import DatabaseWriter
+from src.replay import PageCorpus
+from src.scheduler import RevisitScheduler, location_key
+from src.scraper_continuous import MapLeadsScraper
+
+CATEGORY = 'plumber'
+
+# Phones on synthetic pages and filler phones only in the database never collide
+PAGE_PHONE_BASE = 2000000000
+FILLER_PHONE_BASE = 8000000000
+
+def format_phone(number: int) -> str:
+    digits = f"{number:010d}"
+    return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
+
+def synthetic_locations(count: int):
+    """Distinct search points spread over a grid"""
+    return [
+        {
+            'city': f'City {i}',
+            'state': 'ST',
+            'zip': f'{10000 + i}',
+            'lat': round(30 + (i // 100) * 0.1, 5),
+            'lng': round(-120 + (i % 100) * 0.1, 5),
+            'population': count - i,
+        }
+        for i in range(count)
+    ]
+
+def synthetic_page(location_index: int, cards_per_page: int):
+    """HTML for one results page plus the card payload the extraction script returns for it"""
+    cards = []
+    card_html = []
+    for j in range(cards_per_page):
+        name = f'Plumbing Co {location_index}-{j}'
+        lines = [name, f'4.{j % 10}({10 + j})', f'Plumber · {j + 1} Main St',
+                 f'Open 24 hours · {format_phone(PAGE_PHONE_BASE + location_index * cards_per_page + j)}']
+        website = f'https://plumbing-{location_index}-{j}.example.com' if j % 2 == 0 else None
+        place_url = f'https://www.google.com/maps/place/{location_index}-{j}'
+        cards.append({'text': '\n'.join(lines), 'website': website, 'place_url': place_url})
+
+        body = ''.join(f'<div>{escape(line)}</div>' for line in lines)
+        if website:
+            body += f'<a href="{website}"><div>Website</div></a>'
+        body += f'<a href="{place_url}"></a>'
+        card_html.append(f'<div jsaction="mouseover:pane.card">{body}</div>')
+
+    html = (
+        '<html><body><div role="feed" style="height:600px;overflow:auto">'
+        + ''.join(card_html)
+        + "<div>You've reached the end of the list.</div></div></body></html>"
+    )
+    return html, cards
+
+def build_corpus(directory: Path, locations, cards_per_page: int) -> PageCorpus:
+    """Record one synthetic page per location, under the URL the scraper will request"""
+    corpus = PageCorpus(directory)
+    url_builder = MapLeadsScraper.__new__(MapLeadsScraper)
+    for i, location in enumerate(locations):
+        html, cards = synthetic_page(i, cards_per_page)
+        corpus.save(url_builder._search_url(CATEGORY, location), html, cards)
+    corpus.close()
+    return corpus
+
+def build_database(db_path: Path, rows: int, locations, cards_per_page: int, known_fraction: float):
+    """Database with `rows` businesses, `known_fraction` of the page phones among them"""
+    db = Database(str(db_path))
+    page_phones = len(locations) * cards_per_page
+    known = min(int(page_phones * known_fraction), rows)
+    now = datetime.now()
+
+    def row(i):
+        number = PAGE_PHONE_BASE + i if i < known else FILLER_PHONE_BASE + i
+        first_seen = (now - timedelta(days=random.random() * 365)).strftime('%Y-%m-%d %H:%M:%S')
+        return (f'Business {i}', str(number), 'Plumber', f'{i} Main St', 'City', 'ST', '10000',
+                None, None, None, '4.5(10)', 4.5, 'synthetic', None, first_seen, first_seen)
+
+    with db._connection() as conn:
+        batch = 10000
+        for start in range(0, rows, batch):
+            conn.executemany(
+                f"INSERT INTO businesses ({BUSINESS_COLUMNS}, first_seen, last_seen) "
+                f"VALUES ({BUSINESS_PLACEHOLDERS}, ?, ?)",
+                [row(i) for i in range(start, min(start + batch, rows))]
+            )
+    db.close()
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(round(fraction * (len(ordered) - 1))), len(ordered) - 1)]
+
+def run_scan(db_path: Path, corpus_dir: Path, locations, instances: int, browser: bool, headless: bool):
+    """One full parallel pass over every location, returning timings"""
+    db = Database(str(db_path))
+    scraper = MapLeadsScraper(db, headless=headless)
+    scraper.enable_replay(str(corpus_dir), browser=browser)
+
+    started = {}
+    latencies = []
+    upsert_time = [0.0]
+    upsert_rows = [0]
+    timing_lock = threading.Lock()
+
+    # Latency runs from a location being taken off the queue to its page being committed
+    checkpoint = scraper._checkpoint
+    def timed_checkpoint(location, status, error=None):
+        key = location_key(location)
+        with timing_lock:
+            if status == 'in_flight':
+                started[key] = time.perf_counter()
+            elif status == 'done' and key in started:
+                latencies.append(time.perf_counter() - started.pop(key))
+        checkpoint(location, status, error)
+    scraper._checkpoint = timed_checkpoint
+
+    upsert = db.upsert_businesses
+    def timed_upsert(businesses, phone_index=None):
+        start = time.perf_counter()
+        new_phones = upsert(businesses, phone_index)
+        upsert_time[0] += time.perf_counter() - start
+        upsert_rows[0] += len(businesses)
+        return new_phones
+    db.upsert_businesses = timed_upsert
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            if not scraper.setup_multiple_drivers(instances):
+                raise RuntimeError(f'Could not start {instances} drivers')
+            scraper._load_phone_index()
+            scraper.scheduler = RevisitScheduler(db, CATEGORY)
+            scraper.writer = DatabaseWriter(db, scraper.phone_index)
+            scraper.writer.start()
+
+            start = time.perf_counter()
+            scraper._process_locations_parallel(locations, CATEGORY, instances)
+            scraper.writer.flush()
+            seconds = time.perf_counter() - start
+    finally:
+        with contextlib.redirect_stdout(io.StringIO()):
+            scraper.cleanup()
+        db.close()
+
+    pages = scraper.stats['urls_processed']
+    cards = sum(stats['businesses_found'] for stats in scraper.instance_stats.values())
+    return {
+        'instances': instances,
+        'locations': len(locations),
+        'seconds': round(seconds, 3),
+        'pages_per_minute': round(pages / seconds * 60, 1),
+        'cards_per_second': round(cards / seconds, 1),
+        'upserts_per_second': round(upsert_rows[0] / upsert_time[0], 1) if upsert_time[0] else 0.0,
+        'new_businesses': scraper.stats['new_businesses'],
+        'existing_businesses': scraper.stats['existing_businesses'],
+        'latency_p50_ms': round(percentile(latencies, 0.50) * 1000, 2),
+        'latency_p95_ms': round(percentile(latencies, 0.95) * 1000, 2),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--locations', type=int, default=200, help='Synthetic search locations')
+    parser.add_argument('--cards', type=int, default=20, help='Business cards per results page')
+    parser.add_argument('--db-rows', type=int, default=10000, help='Businesses already in the database')
+    parser.add_argument('--known-fraction', type=float, default=0.5,
+                        help='Share of page businesses already in the database')
+    parser.add_argument('--instances', default='1,2,4', help='Comma-separated browser instance counts')
+    parser.add_argument('--browser', action='store_true',
+                        help='Load pages in Chrome from a local server instead of the browser-free driver')
+    parser.add_argument('--no-headless', dest='headless', action='store_false')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='Save results as JSON for regression comparison')
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    instance_counts = [int(value) for value in args.instances.split(',')]
+    locations = synthetic_locations(args.locations)
+
+    print("⏱️  MapLeads scraper throughput benchmark")
+    print(f"   {args.locations} locations x {args.cards} cards, {args.db_rows} rows in the database, "
+          f"{'Chrome' if args.browser else 'browser-free'} replay\n")
+
+    results = {
+        'config': {
+            'locations': args.locations,
+            'cards_per_page': args.cards,
+            'db_rows': args.db_rows,
+            'known_fraction': args.known_fraction,
+            'browser': args.browser,
+        },
+        'runs': []
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        build_corpus(tmp / 'corpus', locations, args.cards)
+        build_database(tmp / 'base.db', args.db_rows, locations, args.cards, args.known_fraction)
+
+        for instances in instance_counts:
+            # Every run starts from the same database
+            db_path = tmp / f'run_{instances}.db'
+            shutil.copy(tmp / 'base.db', db_path)
+            run = run_scan(db_path, tmp / 'corpus', locations, instances, args.browser, args.headless)
+            results['runs'].append(run)
+
+            print(f"✅ {instances} instance(s): {run['pages_per_minute']:9.1f} pages/min  "
+                  f"{run['cards_per_second']:8.1f} cards/s  {run['upserts_per_second']:9.1f} upserts/s  "
+                  f"p50 {run['latency_p50_ms']:7.2f} ms  p95 {run['latency_p95_ms']:7.2f} ms")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📁 Results saved to {args.output}")
+
+if __name__ == '__main__':
+    main()
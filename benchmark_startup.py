@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for the MapLeads CLI
+Runs each subcommand in a fresh interpreter, times it, and fails if a
+lightweight command pulls in browser automation or pandas
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent
+
+# Modules that only the scraping and file-conversion paths should load
+BROWSER_MODULES = ['selenium', 'webdriver_manager']
+HEAVY_MODULES = BROWSER_MODULES + ['pandas', 'numpy']
+
+# (label, CLI arguments, modules that must stay unloaded)
+COMMANDS = [
+    ('--help', ['--help'], HEAVY_MODULES),
+    ('categories', ['categories'], HEAVY_MODULES),
+    ('status', ['status'], HEAVY_MODULES),
+    ('export --days 0', ['export', '--days', '0', '--output', '{tmp}/startup_export.csv'], HEAVY_MODULES),
+    ('run --help', ['run', '--help'], HEAVY_MODULES),
+    ('import-data --help', ['import-data', '--help'], HEAVY_MODULES),
+]
+
+# Executed in the child interpreter: run one command, report time and loaded modules
+CHILD_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+import mapleads
+try:
+    mapleads.cli.main({args!r}, prog_name='mapleads', standalone_mode=False)
+except SystemExit:
+    pass
+elapsed = time.perf_counter() - start
+loaded = sorted({{name.split('.')[0] for name in sys.modules}})
+sys.stderr.write('@@RESULT@@' + json.dumps({{'seconds': elapsed, 'modules': loaded}}) + '\\n')
+"""
+
+def time_command(args, repeat):
+    """Run a CLI command `repeat` times in fresh interpreters"""
+    timings = []
+    modules = set()
+    
+    for _ in range(repeat):
+        script = CHILD_SCRIPT.format(root=str(PROJECT_ROOT), args=args)
+        proc = subprocess.run(
+            [sys.executable, '-c', script],
+            cwd=str(PROJECT_ROOT),
+            capture_output=True,
+            text=True
+        )
+        result_line = next(
+            (line for line in proc.stderr.splitlines() if line.startswith('@@RESULT@@')),
+            None
+        )
+        if result_line is None:
+            raise RuntimeError(f"Command {args} failed:\n{proc.stderr}")
+        
+        result = json.loads(result_line[len('@@RESULT@@'):])
+        timings.append(result['seconds'])
+        modules.update(result['modules'])
+    
+    return timings, modules
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per command')
+    parser.add_argument('--max-ms', type=float, default=None,
+                        help='Fail if a command median exceeds this many milliseconds')
+    parser.add_argument('--output', help='Save results as JSON for regression comparison')
+    args = parser.parse_args()
+    
+    print("⏱️  MapLeads CLI cold-start benchmark")
+    print(f"   Python {sys.version.split()[0]}, {args.repeat} runs per command\n")
+    
+    results = {}
+    failures = []
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, cli_args, forbidden in COMMANDS:
+            cli_args = [arg.format(tmp=tmp) for arg in cli_args]
+            timings, modules = time_command(cli_args, args.repeat)
+            
+            median_ms = statistics.median(timings) * 1000
+            leaked = sorted(set(forbidden) & modules)
+            results[label] = {
+                'median_ms': round(median_ms, 1),
+                'min_ms': round(min(timings) * 1000, 1),
+                'forbidden_modules_loaded': leaked
+            }
+            
+            marker = '✅'
+            if leaked:
+                marker = '❌'
+                failures.append(f"{label}: loaded {', '.join(leaked)}")
+            if args.max_ms is not None and median_ms > args.max_ms:
+                marker = '❌'
+                failures.append(f"{label}: {median_ms:.0f}ms exceeds {args.max_ms:.0f}ms")
+            
+            print(f"{marker} {label:<22} median {median_ms:7.1f} ms   min {min(timings) * 1000:7.1f} ms")
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📁 Results saved to {args.output}")
+    
+    if failures:
+        print("\n❌ Cold-start regressions:")
+        for failure in failures:
+            print(f"   • {failure}")
+        sys.exit(1)
+    
+    print("\n✅ All commands start without loading heavy dependencies")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Synthetic business data for MapLeads
+Fills a database with realistic-looking businesses so queries and schema
+changes can be measured at production sizes
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.database import BUSINESS_COLUMNS, BUSINESS_PLACEHOLDERS, Database
+from src.locations import filter_locations
+
+CATEGORIES = [
+    'Plumber', 'Electrician', 'HVAC contractor', 'Roofing contractor', 'Painter',
+    'General contractor', 'Handyman', 'Landscaper', 'Pest control service',
+    'Restaurant', 'Cafe', 'Bakery', 'Bar', 'Pizza restaurant', 'Coffee shop',
+    'Gym', 'Yoga studio', 'Dentist', 'Chiropractor', 'Beauty salon', 'Barber shop',
+    'Auto repair shop', 'Car dealer', 'Tire shop', 'Car wash',
+    'Lawyer', 'Accountant', 'Insurance agency', 'Real estate agency',
+    'Clothing store', 'Gift shop', 'Book store', 'Pet store', 'Furniture store',
+]
+
+NAME_WORDS = [
+    'Main Street', 'Golden', 'Summit', 'Blue Sky', 'Family', 'Premier', 'Elite',
+    'Hometown', 'Riverside', 'Pioneer', 'Evergreen', 'Liberty', 'Sunrise', 'Metro',
+    'Valley', 'Coastal', 'Northside', 'Precision', 'Reliable', 'Heritage',
+]
+
+STREETS = ['Main', 'Oak', 'Maple', 'Cedar', 'Pine', 'Elm', 'Washington', 'Lake',
+           'Hill', 'Park', 'Broadway', 'Market', 'Church', 'Center', 'Mill']
+
+# Phones are a bijection of the row number onto 10-digit numbers, so row i
+# always gets the same phone and numbers past the row count are never used
+PHONE_BASE = 2000000000
+PHONE_SPACE = 8000000000
+PHONE_MULTIPLIER = 2654435761
+
+# Most businesses are found by the first (baseline) scan; the rest trickle in
+BASELINE_SHARE = 0.8
+BASELINE_DAYS = 7
+
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+def synthetic_phone(i: int) -> str:
+    """Unique phone number for row i"""
+    return str(PHONE_BASE + (i * PHONE_MULTIPLIER) % PHONE_SPACE)
+
+def generate_businesses(count: int, history_days: int = 365, seed: int = 0, start: int = 0):
+    """Yield INSERT tuples (business columns, first_seen, last_seen) for rows start..start+count
+
+    Cities and states are drawn from the ZIP code data weighted by population.
+    first_seen follows a baseline burst at the start of the history followed
+    by a steady trickle of new businesses up to now.
+    """
+    rng = random.Random(seed + start)
+    locations = [loc for loc in filter_locations() if loc.get('population')]
+    weights = []
+    total = 0
+    for loc in locations:
+        total += loc['population']
+        weights.append(total)
+
+    now = datetime.now()
+    history_start = now - timedelta(days=history_days)
+
+    for i in range(start, start + count):
+        location = rng.choices(locations, cum_weights=weights)[0]
+        category = rng.choice(CATEGORIES)
+
+        if rng.random() < BASELINE_SHARE:
+            first_seen = history_start + timedelta(days=rng.random() * BASELINE_DAYS)
+        else:
+            first_seen = history_start + timedelta(days=rng.random() * history_days)
+        last_seen = first_seen + (now - first_seen) * rng.random()
+
+        review_count = int(rng.paretovariate(1.2) * 5)
+        rating = round(rng.uniform(3.0, 5.0), 1)
+        yield (
+            f'{rng.choice(NAME_WORDS)} {category}',
+            synthetic_phone(i),
+            category,
+            f'{rng.randint(1, 9999)} {rng.choice(STREETS)} St',
+            location['city'],
+            location['state'],
+            location.get('zip'),
+            round(location['lat'] + rng.uniform(-0.05, 0.05), 6),
+            round(location['lng'] + rng.uniform(-0.05, 0.05), 6),
+            f'https://www.business{i}.example.com' if rng.random() < 0.6 else None,
+            f'{rating}({review_count})',
+            rating,
+            'synthetic',
+            '{}',
+            first_seen.strftime(TIMESTAMP_FORMAT),
+            last_seen.strftime(TIMESTAMP_FORMAT),
+        )
+
+def populate_database(db: Database, count: int, history_days: int = 365, seed: int = 0,
+                      batch_size: int = 50000, progress: bool = False) -> int:
+    """Append `count` synthetic businesses after the synthetic rows already in the database"""
+    with db._connection() as conn:
+        start = conn.execute("SELECT COUNT(*) FROM businesses WHERE source_url = 'synthetic'").fetchone()[0]
+
+    rows = generate_businesses(count, history_days, seed, start)
+    inserted = 0
+    while inserted < count:
+        batch = [row for _, row in zip(range(batch_size), rows)]
+        if not batch:
+            break
+        with db._connection() as conn:
+            conn.executemany(
+                f"INSERT OR IGNORE INTO businesses ({BUSINESS_COLUMNS}, first_seen, last_seen) "
+                f"VALUES ({BUSINESS_PLACEHOLDERS}, ?, ?)",
+                batch
+            )
+        inserted += len(batch)
+        if progress:
+            print(f"   {inserted:,}/{count:,} rows", end='\r', flush=True)
+
+    if progress:
+        print()
+    return inserted
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=100000, help='Businesses to add')
+    parser.add_argument('--db', required=True, help='Database file to fill (created if missing)')
+    parser.add_argument('--history-days', type=int, default=365, help='Days of first_seen history')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"🏗️  Generating {args.rows:,} synthetic businesses into {args.db}")
+    start = time.perf_counter()
+    with Database(args.db) as db:
+        populate_database(db, args.rows, args.history_days, args.seed, progress=True)
+    print(f"✅ Done in {time.perf_counter() - start:.1f}s")
+
+if __name__ == '__main__':
+    main()
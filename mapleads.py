@@ -5,17 +5,15 @@ Monitor Google Maps for new business listings in your target market
 """
 
 import click
+import itertools
 import sys
 from pathlib import Path
 from datetime import datetime
 from rich.console import Console
 from rich.table import Table
-from rich.progress import track
 
-from src.config_manager import ConfigManager
-from src.scraper_continuous import MapLeadsScraper
-from src.database import Database
-from src.interactive_setup import InteractiveSetup
+# Project modules are imported inside each command so that lightweight
+# commands (status, export, categories) never load selenium or pandas.
 
 console = Console()
 
@@ -28,6 +26,8 @@ def cli():
 @cli.command()
 def setup():
     """Interactive setup wizard to configure MapLeads"""
+    from src.interactive_setup import InteractiveSetup
+    
     console.print("\n[bold blue]Welcome to MapLeads Setup Wizard! 🗺️[/bold blue]\n")
     
     setup_wizard = InteractiveSetup()
@@ -40,6 +40,8 @@ def setup():
 @click.argument('new_category', required=False)
 def category(new_category):
     """Change the monitoring category (e.g., 'restaurant', 'gym', 'plumber')"""
+    from src.config_manager import ConfigManager
+    
     config_manager = ConfigManager()
     
     if not config_manager.config_exists():
@@ -90,6 +92,8 @@ def category(new_category):
 @click.argument('num_instances', type=int, required=False)
 def instances(num_instances):
     """Change the number of browser instances (1-5) for parallel processing"""
+    from src.config_manager import ConfigManager
+    
     config_manager = ConfigManager()
     
     if not config_manager.config_exists():
@@ -135,8 +139,13 @@ def instances(num_instances):
 
 @cli.command()
 @click.option('--headless/--no-headless', default=True, help='Run browser in headless mode')
-def run(headless):
+@click.option('--record', 'record_dir', help='Record rendered result pages to this directory')
+def run(headless, record_dir):
     """Start monitoring for new businesses"""
+    from src.config_manager import ConfigManager
+    from src.database import Database
+    from src.scraper_continuous import MapLeadsScraper
+    
     config_manager = ConfigManager()
     
     if not config_manager.config_exists():
@@ -151,6 +160,9 @@ def run(headless):
     
     db = Database()
     scraper = MapLeadsScraper(db, headless=headless)
+    if record_dir:
+        scraper.enable_recording(record_dir)
+        console.print(f"Recording result pages to: {record_dir}")
     
     try:
         # Continuous monitoring mode
@@ -167,11 +179,14 @@ def run(headless):
         sys.exit(1)
     finally:
         scraper.cleanup()
+        db.close()
 
 
 @cli.command()
 def status():
     """View monitoring statistics and recent discoveries"""
+    from src.database import Database
+    
     db = Database()
     stats = db.get_statistics()
     
@@ -209,16 +224,30 @@ def status():
         
         console.print(recent_table)
 
+@cli.command('rebuild-stats')
+def rebuild_stats():
+    """Recompute the statistics rollups from the businesses table"""
+    from src.database import Database
+    
+    db = Database()
+    console.print("[yellow]Rebuilding statistics rollups...[/yellow]")
+    total = db.rebuild_statistics()
+    console.print(f"[green]✅ Statistics rebuilt from {total} businesses[/green]")
+
 @cli.command()
-@click.option('--format', type=click.Choice(['csv', 'json', 'xlsx']), default='csv')
+@click.option('--format', type=click.Choice(['csv', 'json', 'jsonl', 'xlsx', 'parquet', 'feather']), default='csv')
 @click.option('--days', default=30, help='Export businesses from last N days')
 @click.option('--output', help='Output filename')
 def export(format, days, output):
     """Export discovered businesses to file"""
+    from src.database import Database
+    
     db = Database()
-    businesses = db.get_businesses_since_days(days)
+    businesses = db.iter_businesses_since_days(days)
     
-    if not businesses:
+    # Peek at the first row so an empty export doesn't create a file
+    first = next(businesses, None)
+    if first is None:
         console.print(f"[yellow]No businesses found in the last {days} days.[/yellow]")
         return
     
@@ -228,70 +257,116 @@ def export(format, days, output):
     
     try:
         from src.exporter import export_businesses
-        export_businesses(businesses, output, format)
-        console.print(f"[green]✅ Exported {len(businesses)} businesses to {output}[/green]")
+        count = export_businesses(itertools.chain([first], businesses), output, format)
+        console.print(f"[green]✅ Exported {count} businesses to {output}[/green]")
     except Exception as e:
         console.print(f"[red]Export failed: {e}[/red]")
 
 @cli.command()
 @click.argument('file_path', type=click.Path(exists=True))
 @click.option('--dry-run', is_flag=True, help='Validate the file without importing')
-def import_data(file_path, dry_run):
-    """Import businesses from CSV, JSON, or Excel file"""
+@click.option('--chunk-size', default=20000, help='Rows read, validated and committed at a time')
+def import_data(file_path, dry_run, chunk_size):
+    """Import businesses from CSV, JSON, JSON Lines, Excel, Parquet or Feather file"""
+    db = None
     try:
-        from src.exporter import import_businesses
+        from src.exporter import iter_import_businesses
         
         console.print(f"[yellow]Importing businesses from: {file_path}[/yellow]")
         
-        # Import and validate
-        businesses, errors = import_businesses(file_path)
+        # The file is streamed in chunks and never held in memory whole, so
+        # confirm up front rather than after counting the valid rows
+        if not dry_run:
+            from rich.prompt import Confirm
+            if not Confirm.ask("\nImport valid businesses from this file to database?"):
+                console.print("[yellow]Import cancelled[/yellow]")
+                return
+            
+            from src.database import Database
+            db = Database()
+        
+        rows = 0
+        valid = 0
+        inserted = 0
+        existing = 0
+        error_count = 0
         
-        if errors:
-            console.print(f"\n[red]Validation errors found:[/red]")
-            for error in errors[:10]:  # Show first 10 errors
-                console.print(f"  • {error}")
-            if len(errors) > 10:
-                console.print(f"  ... and {len(errors) - 10} more errors")
+        # Read, validate and commit one chunk at a time
+        for businesses, errors, chunk_rows in iter_import_businesses(file_path, chunk_size):
+            rows += chunk_rows
+            valid += len(businesses)
             
-            if not businesses:
-                console.print(f"\n[red]No valid businesses found in import file.[/red]")
-                return
+            for error in errors:
+                if error_count == 0:
+                    console.print(f"\n[red]Validation errors found:[/red]")
+                if error_count < 10:  # Show first 10 errors
+                    console.print(f"  • {error}")
+                error_count += 1
+            
+            if db is not None and businesses:
+                counts = db.bulk_import(businesses)
+                inserted += counts['inserted']
+                existing += counts['existing']
+                console.print(f"[dim]  {rows:,} rows read, {valid:,} valid, {inserted:,} new[/dim]")
+            else:
+                console.print(f"[dim]  {rows:,} rows read, {valid:,} valid[/dim]")
         
-        console.print(f"\n[green]Found {len(businesses)} valid businesses to import[/green]")
+        if error_count > 10:
+            console.print(f"  ... and {error_count - 10} more errors")
         
-        if dry_run:
-            console.print("[yellow]Dry run complete - no data was imported[/yellow]")
+        if not valid:
+            console.print(f"\n[red]No valid businesses found in import file.[/red]")
             return
         
-        # Confirm import
-        from rich.prompt import Confirm
-        if not Confirm.ask(f"\nImport {len(businesses)} businesses to database?"):
-            console.print("[yellow]Import cancelled[/yellow]")
+        if dry_run:
+            console.print(f"\n[green]Found {valid} valid businesses to import[/green]")
+            console.print("[yellow]Dry run complete - no data was imported[/yellow]")
             return
         
-        # Import to database
-        db = Database()
-        imported_count = 0
-        duplicate_count = 0
-        
-        for business in businesses:
-            if db.business_exists(business['phone']):
-                duplicate_count += 1
-                # Update last seen for existing businesses
-                db.update_last_seen(business['phone'])
-            else:
-                db.add_business(business)
-                imported_count += 1
-        
         console.print(f"\n[green]✅ Import completed![/green]")
-        console.print(f"   New businesses imported: {imported_count}")
-        console.print(f"   Duplicates skipped: {duplicate_count}")
-        
-        if errors:
-            console.print(f"   Rows with errors: {len(errors)}")
+        console.print(f"   New businesses imported: {inserted}")
+        console.print(f"   Duplicates skipped: {existing}")
         
+        if error_count:
+            console.print(f"   Rows with errors: {error_count}")
+    
     except Exception as e:
         console.print(f"[red]Import failed: {e}[/red]")
+    finally:
+        if db is not None:
+            db.close()
+
+@cli.command()
+@click.argument('corpus', type=click.Path(exists=True, file_okay=False))
+@click.option('--db', 'db_path', default='data/replay.db', help='Database to save replayed businesses to')
+@click.option('--browser', is_flag=True, help='Load recorded pages in Chrome instead of replaying without a browser')
+@click.option('--headless/--no-headless', default=True, help='Run browser in headless mode')
+def replay(corpus, db_path, browser, headless):
+    """Run recorded result pages through the scraping pipeline offline"""
+    from src.database import Database
+    from src.replay import run_replay
+    from src.scraper_continuous import MapLeadsScraper
+    
+    db = Database(db_path)
+    scraper = MapLeadsScraper(db, headless=headless)
+    scraper.enable_replay(corpus, browser=browser)
+    
+    try:
+        console.print(f"\n[bold]Replaying {len(scraper.replay_corpus)} recorded pages[/bold]")
+        result = run_replay(scraper, scraper.replay_corpus)
+        
+        console.print(f"\n[green]✅ Replay complete[/green]")
+        console.print(f"   Pages: {result['pages']}")
+        console.print(f"   Cards: {result['cards']}")
+        console.print(f"   Businesses parsed: {result['businesses']}")
+        console.print(f"   New businesses: {result['new_businesses']}")
+        console.print(f"   Time: {result['seconds']:.2f}s ({result['pages_per_minute']:.0f} pages/min)")
+    except Exception as e:
+        console.print(f"[red]Replay failed: {e}[/red]")
+        sys.exit(1)
+    finally:
+        scraper.cleanup()
+        db.close()
 
 @cli.command()
 def categories():
@@ -334,6 +409,9 @@ def categories():
 @cli.command()
 def test():
     """Run a test scan with minimal searches"""
+    from src.database import Database
+    from src.scraper_continuous import MapLeadsScraper
+    
     console.print("\n[bold yellow]Running test scan...[/bold yellow]\n")
     
     # Create minimal test config
@@ -45,6 +45,7 @@ setup(
     ],
     extras_require={
         "email": ["yagmail>=0.15.0"],
+        "analytics": ["pyarrow>=14.0.0"],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -59,6 +60,6 @@ setup(
     },
     include_package_data=True,
     package_data={
-        "": ["data/*.csv", "data/*.db"],
+        "": ["data/*.csv", "data/*.db", "data/*.bin"],
     },
 )
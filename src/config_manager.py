@@ -19,6 +19,17 @@ class MonitoringConfig(BaseModel):
     locations: LocationConfig
     batch_size: int = 10
     browser_instances: int = 1  # Number of parallel browser instances (1-5)
+    search_grid: bool = True  # Merge nearby ZIP codes into one search per map viewport
+    max_split_zoom: int = 16  # Split searches with a full result list down to this zoom (13 disables)
+    revisit_base_hours: float = 24  # Revisit interval before adjusting for a location's yield
+    min_revisit_hours: float = 1  # Never rescan a location more often than this
+    freshness_sla_hours: float = 168  # Never leave a location unscanned longer than this
+    freshness_overrides: Optional[Dict[str, float]] = None  # SLA hours per ZIP, "City, ST" or state
+    location_retries: int = 2  # Times a failed location is retried within a cycle
+    feed_timeout: float = 10  # Seconds to wait for a search's results list to appear
+    results_timeout: float = 20  # Seconds to keep scrolling a results list
+    results_idle_timeout: float = 4  # Seconds without new results before a list counts as loaded
+    card_extraction: str = 'javascript'  # 'javascript' reads all cards in one call; 'webdriver' per card
 
 class MapLeadsConfig(BaseModel):
     monitoring: MonitoringConfig
@@ -0,0 +1,105 @@
+"""
+Search coverage planning for MapLeads
+Merges ZIP code centroids into map-viewport tiles so each area is searched once
+"""
+
+import math
+from typing import Dict, List
+
+# Zoom level used for Google Maps searches
+SEARCH_ZOOM = 13
+
+# Viewport of the headless browser window, in screen pixels
+DEFAULT_VIEWPORT_WIDTH = 800
+DEFAULT_VIEWPORT_HEIGHT = 600
+
+# Google Maps renders the world as 256px tiles at zoom 0
+TILE_SIZE = 256
+
+# Google Maps stops a result list at this many places; a full list means
+# the viewport probably holds more businesses than were shown
+RESULT_LIST_CAP = 120
+
+# Deepest zoom a saturated search is split down to
+MAX_SPLIT_ZOOM = 16
+
+def _world_pixel(lat: float, lng: float, zoom: int):
+    """Project a coordinate to Web Mercator pixel space at the given zoom"""
+    scale = TILE_SIZE * (2 ** zoom)
+    x = (lng + 180.0) / 360.0 * scale
+    sin_lat = min(max(math.sin(math.radians(lat)), -0.9999), 0.9999)
+    y = (0.5 - math.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi)) * scale
+    return x, y
+
+def _world_coordinate(x: float, y: float, zoom: int):
+    """Inverse of _world_pixel"""
+    scale = TILE_SIZE * (2 ** zoom)
+    lng = x / scale * 360.0 - 180.0
+    n = math.pi - 2 * math.pi * y / scale
+    lat = math.degrees(math.atan(math.sinh(n)))
+    return lat, lng
+
+def plan_search_points(locations: List[Dict],
+                       zoom: int = SEARCH_ZOOM,
+                       viewport_width: int = DEFAULT_VIEWPORT_WIDTH,
+                       viewport_height: int = DEFAULT_VIEWPORT_HEIGHT,
+                       overlap: float = 0.1) -> List[Dict]:
+    """Collapse ZIP locations into one search point per viewport-sized tile
+    
+    The map is cut into a grid of tiles the size of the browser viewport at
+    the search zoom (shrunk by `overlap` so neighbouring searches overlap a
+    little at the edges). Every tile containing at least one ZIP centroid
+    becomes a single search at the tile's center, so dense metros get one
+    search per viewport instead of one per ZIP code.
+    
+    Each returned location keeps the city/state/zip of the most populous ZIP
+    in the tile, sums the population, lists the merged ZIPs under 'zips', and
+    is ordered by population like get_locations_for_filters.
+    """
+    tile_width = viewport_width * (1 - overlap)
+    tile_height = viewport_height * (1 - overlap)
+    
+    tiles = {}
+    for location in locations:
+        x, y = _world_pixel(location['lat'], location['lng'], zoom)
+        key = (int(x // tile_width), int(y // tile_height))
+        tiles.setdefault(key, []).append(location)
+    
+    points = []
+    for (col, row), members in tiles.items():
+        anchor = max(members, key=lambda loc: loc.get('population') or 0)
+        lat, lng = _world_coordinate((col + 0.5) * tile_width, (row + 0.5) * tile_height, zoom)
+        
+        point = dict(anchor)
+        point['lat'] = round(lat, 5)
+        point['lng'] = round(lng, 5)
+        point['zoom'] = zoom
+        point['population'] = sum(loc.get('population') or 0 for loc in members)
+        point['zips'] = [loc['zip'] for loc in members if loc.get('zip')]
+        points.append(point)
+    
+    points.sort(key=lambda loc: loc['population'], reverse=True)
+    return points
+
+def split_viewport(location: Dict,
+                   viewport_width: int = DEFAULT_VIEWPORT_WIDTH,
+                   viewport_height: int = DEFAULT_VIEWPORT_HEIGHT) -> List[Dict]:
+    """Split a search viewport into its four quadrants at the next zoom level
+    
+    A viewport at zoom z+1 covers exactly one quarter of the same-sized
+    viewport at zoom z, so the four children tile the parent with no gaps.
+    """
+    zoom = location.get('zoom', SEARCH_ZOOM)
+    x, y = _world_pixel(location['lat'], location['lng'], zoom)
+    
+    children = []
+    for dy in (-0.25, 0.25):
+        for dx in (-0.25, 0.25):
+            lat, lng = _world_coordinate(x + dx * viewport_width, y + dy * viewport_height, zoom)
+            child = dict(location)
+            child['lat'] = round(lat, 5)
+            child['lng'] = round(lng, 5)
+            child['zoom'] = zoom + 1
+            children.append(child)
+    
+    return children
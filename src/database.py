@@ -3,12 +3,156 @@ Database management for MapLeads using SQLite
 Simple, file-based database that requires no setup
 """
 
+import base64
+import binascii
+import re
 import sqlite3
 import json
+import threading
+import weakref
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional
-import pandas as pd
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .locations import filter_locations
+
+# Pragmas applied to every connection opened by Database. WAL lets the web UI
+# read while the scraper writes, and NORMAL sync is durable enough under WAL.
+CONNECTION_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-16000',
+    'PRAGMA busy_timeout=30000',
+)
+
+# Columns written when a scraped or imported business is inserted
+BUSINESS_COLUMNS = (
+    'name, phone, category, address, city, state, zip_code, '
+    'latitude, longitude, website, reviews, rating, source_url, metadata'
+)
+BUSINESS_PLACEHOLDERS = ', '.join(['?'] * 14)
+
+# Per-day, per-category and per-state business counts. Triggers keep them in
+# step with every insert, delete and category/state/first_seen change, so
+# get_statistics never has to scan businesses. NULL category/state count as ''.
+STATISTICS_ROLLUP_SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily_business_counts (
+    day TEXT PRIMARY KEY,
+    businesses INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS category_business_counts (
+    category TEXT PRIMARY KEY,
+    businesses INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS state_business_counts (
+    state TEXT PRIMARY KEY,
+    businesses INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER IF NOT EXISTS businesses_rollup_insert AFTER INSERT ON businesses
+BEGIN
+    INSERT INTO daily_business_counts (day, businesses) VALUES (date(NEW.first_seen), 1)
+        ON CONFLICT(day) DO UPDATE SET businesses = businesses + 1;
+    INSERT INTO category_business_counts (category, businesses) VALUES (COALESCE(NEW.category, ''), 1)
+        ON CONFLICT(category) DO UPDATE SET businesses = businesses + 1;
+    INSERT INTO state_business_counts (state, businesses) VALUES (COALESCE(NEW.state, ''), 1)
+        ON CONFLICT(state) DO UPDATE SET businesses = businesses + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS businesses_rollup_delete AFTER DELETE ON businesses
+BEGIN
+    UPDATE daily_business_counts SET businesses = businesses - 1 WHERE day = date(OLD.first_seen);
+    UPDATE category_business_counts SET businesses = businesses - 1 WHERE category = COALESCE(OLD.category, '');
+    UPDATE state_business_counts SET businesses = businesses - 1 WHERE state = COALESCE(OLD.state, '');
+END;
+
+CREATE TRIGGER IF NOT EXISTS businesses_rollup_update
+AFTER UPDATE OF first_seen, category, state ON businesses
+BEGIN
+    UPDATE daily_business_counts SET businesses = businesses - 1 WHERE day = date(OLD.first_seen);
+    UPDATE category_business_counts SET businesses = businesses - 1 WHERE category = COALESCE(OLD.category, '');
+    UPDATE state_business_counts SET businesses = businesses - 1 WHERE state = COALESCE(OLD.state, '');
+    INSERT INTO daily_business_counts (day, businesses) VALUES (date(NEW.first_seen), 1)
+        ON CONFLICT(day) DO UPDATE SET businesses = businesses + 1;
+    INSERT INTO category_business_counts (category, businesses) VALUES (COALESCE(NEW.category, ''), 1)
+        ON CONFLICT(category) DO UPDATE SET businesses = businesses + 1;
+    INSERT INTO state_business_counts (state, businesses) VALUES (COALESCE(NEW.state, ''), 1)
+        ON CONFLICT(state) DO UPDATE SET businesses = businesses + 1;
+END;
+"""
+
+# Sort keys accepted by get_businesses_page: SQL sort expression and direction.
+# Ties break on id. Every expression has an index whose order matches; with a
+# category, state or city filter only 'newest' and 'oldest' have one, the
+# other sorts order the filtered rows in a temporary B-tree.
+BUSINESS_SORTS = {
+    'newest': ('first_seen', 'DESC'),
+    'oldest': ('first_seen', 'ASC'),
+    'name': ('name COLLATE NOCASE', 'ASC'),
+    'rating': ('IFNULL(rating, -1)', 'DESC'),
+}
+
+# Completed scan cycles kept for reference; their per-location checkpoints
+# are deleted on completion and older cycles are pruned
+COMPLETED_SCAN_CYCLES_KEPT = 20
+
+# Full-text index over the searchable columns, kept in step by triggers
+BUSINESS_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS businesses_fts USING fts5(
+    name, category, address, content='businesses', content_rowid='id'
+);
+
+CREATE TRIGGER IF NOT EXISTS businesses_fts_insert AFTER INSERT ON businesses
+BEGIN
+    INSERT INTO businesses_fts (rowid, name, category, address)
+    VALUES (NEW.id, NEW.name, NEW.category, NEW.address);
+END;
+
+CREATE TRIGGER IF NOT EXISTS businesses_fts_delete AFTER DELETE ON businesses
+BEGIN
+    INSERT INTO businesses_fts (businesses_fts, rowid, name, category, address)
+    VALUES ('delete', OLD.id, OLD.name, OLD.category, OLD.address);
+END;
+
+CREATE TRIGGER IF NOT EXISTS businesses_fts_update AFTER UPDATE OF name, category, address ON businesses
+BEGIN
+    INSERT INTO businesses_fts (businesses_fts, rowid, name, category, address)
+    VALUES ('delete', OLD.id, OLD.name, OLD.category, OLD.address);
+    INSERT INTO businesses_fts (rowid, name, category, address)
+    VALUES (NEW.id, NEW.name, NEW.category, NEW.address);
+END;
+"""
+
+def encode_cursor(sort: str, value, business_id: int) -> str:
+    """Opaque pagination cursor for the row (sort value, id) under a sort key"""
+    payload = json.dumps([sort, value, business_id]).encode('utf-8')
+    return base64.urlsafe_b64encode(payload).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor: str, sort: str) -> Tuple[Any, int]:
+    """Inverse of encode_cursor; raises ValueError for anything it did not produce for `sort`"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        cursor_sort, value, business_id = json.loads(base64.urlsafe_b64decode(padded))
+        if cursor_sort != sort or type(business_id) is not int:
+            raise TypeError
+        # Only values SQLite can bind; bool is an int but never a sort value
+        if value is not None and (isinstance(value, bool) or not isinstance(value, (str, int, float))):
+            raise TypeError
+        return value, business_id
+    except (TypeError, ValueError, binascii.Error):
+        raise ValueError(f"Invalid pagination cursor: {cursor!r}")
+
+def fts_query(text: str) -> Optional[str]:
+    """FTS5 MATCH expression requiring every word of `text` as a prefix"""
+    words = re.findall(r'\w+', text)
+    if not words:
+        return None
+    return ' '.join(f'"{word}"*' for word in words)
+
+class _ThreadConnection(sqlite3.Connection):
+    """sqlite3 connection that can be tracked by weak reference"""
 
 class Database:
     def __init__(self, db_path: Optional[str] = None):
@@ -19,12 +163,60 @@ class Database:
             db_path = data_dir / 'mapleads.db'
         
         self.db_path = db_path
+        
+        # One persistent connection per thread, opened lazily and reused.
+        # Tracked weakly so a finished worker thread's connection is freed.
+        self._local = threading.local()
+        self._connections = weakref.WeakSet()
+        self._connections_lock = threading.Lock()
+        
         self.init_database()
-        self._init_locations()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _get_connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, factory=_ThreadConnection)
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.add(conn)
+        return conn
+    
+    @contextmanager
+    def _connection(self, row_factory=None):
+        """Yield this thread's connection inside a transaction.
+        
+        Commits on success and rolls back on error, but leaves the
+        connection open for the next call.
+        """
+        conn = self._get_connection()
+        conn.row_factory = row_factory
+        with conn:
+            yield conn
+    
+    def close(self):
+        """Close every connection opened by this Database"""
+        with self._connections_lock:
+            connections, self._connections = list(self._connections), weakref.WeakSet()
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                # Owned by another thread; it is released when that thread exits
+                pass
+        self._local = threading.local()
     
     def init_database(self):
         """Create tables if they don't exist"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS businesses (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -49,10 +241,19 @@ class Database:
             
             # Create indexes for better performance
             conn.execute('CREATE INDEX IF NOT EXISTS idx_phone ON businesses(phone)')
-            conn.execute('CREATE INDEX IF NOT EXISTS idx_category ON businesses(category)')
             conn.execute('CREATE INDEX IF NOT EXISTS idx_first_seen ON businesses(first_seen)')
             conn.execute('CREATE INDEX IF NOT EXISTS idx_city_state ON businesses(city, state)')
             
+            # Filtered listings: equality on the filter column, then first_seen order
+            conn.execute('DROP INDEX IF EXISTS idx_category')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_category_first_seen ON businesses(category, first_seen)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_state_first_seen ON businesses(state, first_seen)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_state_city_first_seen ON businesses(state, city, first_seen)')
+            
+            # Orders for the other sort keys in BUSINESS_SORTS
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_name_nocase ON businesses(name COLLATE NOCASE)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_rating_sort ON businesses(IFNULL(rating, -1))')
+            
             # Scan history table
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS scan_history (
@@ -66,156 +267,408 @@ class Database:
                 )
             ''')
             
-            conn.commit()
-    
-    def _init_locations(self):
-        """Initialize location data from ZIP codes"""
-        locations_db = Path(__file__).parent.parent / 'data' / 'locations.db'
-        
-        # Only create if it doesn't exist
-        if not locations_db.exists():
-            zip_csv = Path(__file__).parent.parent / 'data' / 'uszips.csv'
+            # Per-location scan history used by the revisit scheduler
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS location_history (
+                    category TEXT NOT NULL,
+                    location_key TEXT NOT NULL,
+                    scans INTEGER DEFAULT 0,
+                    avg_new REAL DEFAULT 0,
+                    churn REAL DEFAULT 0,
+                    empty_streak INTEGER DEFAULT 0,
+                    total_new INTEGER DEFAULT 0,
+                    last_scanned TIMESTAMP,
+                    PRIMARY KEY (category, location_key)
+                )
+            ''')
+            
+            # Resumable scan checkpoints: one row per cycle, one per location in it
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS scan_cycles (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    mode TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    locations TEXT,
+                    started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    completed_at TIMESTAMP
+                )
+            ''')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS scan_cycle_locations (
+                    cycle_id INTEGER NOT NULL,
+                    location_key TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER DEFAULT 0,
+                    error TEXT,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (cycle_id, location_key)
+                )
+            ''')
+            # Checkpoints of cycles completed before they were deleted on completion
+            conn.execute('''
+                DELETE FROM scan_cycle_locations
+                WHERE cycle_id IN (SELECT id FROM scan_cycles WHERE completed_at IS NOT NULL)
+            ''')
+            
+            # Statistics rollups, kept current by triggers on businesses
+            needs_rollup = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'daily_business_counts'"
+            ).fetchone() is None
+            conn.executescript(STATISTICS_ROLLUP_SCHEMA)
             
-            if zip_csv.exists():
-                # Load ZIP data into a separate SQLite table
-                df = pd.read_csv(zip_csv, dtype={'zip': str})
-                
-                # Rename columns to match our needs
-                df = df.rename(columns={
-                    'state_id': 'state',
-                    'county_name': 'county'
-                })
-                
-                with sqlite3.connect(locations_db) as conn:
-                    df.to_sql('locations', conn, if_exists='replace', index=False)
-                    
-                    # Create indexes
-                    conn.execute('CREATE INDEX IF NOT EXISTS idx_state ON locations(state)')
-                    conn.execute('CREATE INDEX IF NOT EXISTS idx_population ON locations(population)')
-                    conn.execute('CREATE INDEX IF NOT EXISTS idx_city ON locations(city)')
+            # Full-text search; builds without FTS5 fall back to LIKE
+            needs_fts = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'businesses_fts'"
+            ).fetchone() is None
+            try:
+                conn.executescript(BUSINESS_FTS_SCHEMA)
+                self.fts_enabled = True
+            except sqlite3.OperationalError:
+                self.fts_enabled = False
+        
+        # Databases created before the rollups existed need them filled once
+        if needs_rollup:
+            self.rebuild_statistics()
+        if needs_fts and self.fts_enabled:
+            self.rebuild_search_index()
+    
+    def rebuild_search_index(self):
+        """Re-index every business for full-text search"""
+        with self._connection() as conn:
+            conn.execute("INSERT INTO businesses_fts (businesses_fts) VALUES ('rebuild')")
+    
+    def rebuild_statistics(self) -> int:
+        """Recompute the statistics rollup tables from businesses, returning the row count"""
+        with self._connection() as conn:
+            conn.execute('DELETE FROM daily_business_counts')
+            conn.execute('DELETE FROM category_business_counts')
+            conn.execute('DELETE FROM state_business_counts')
+            conn.execute('''
+                INSERT INTO daily_business_counts (day, businesses)
+                SELECT date(first_seen), COUNT(*) FROM businesses GROUP BY date(first_seen)
+            ''')
+            conn.execute('''
+                INSERT INTO category_business_counts (category, businesses)
+                SELECT COALESCE(category, ''), COUNT(*) FROM businesses GROUP BY COALESCE(category, '')
+            ''')
+            conn.execute('''
+                INSERT INTO state_business_counts (state, businesses)
+                SELECT COALESCE(state, ''), COUNT(*) FROM businesses GROUP BY COALESCE(state, '')
+            ''')
+            return conn.execute('SELECT COALESCE(SUM(businesses), 0) FROM state_business_counts').fetchone()[0]
     
     def business_exists(self, phone: str) -> bool:
         """Check if a business with this phone number already exists"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute('SELECT 1 FROM businesses WHERE phone = ?', (phone,))
             return cursor.fetchone() is not None
     
-    def add_business(self, business_data: Dict) -> int:
-        """Add a new business to the database"""
+    @staticmethod
+    def _business_values(business_data: Dict) -> tuple:
+        """Build the INSERT parameter tuple for a business dict"""
         # Convert metadata dict to JSON string
         metadata = business_data.get('metadata', {})
         if isinstance(metadata, dict):
             metadata = json.dumps(metadata)
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute('''
-                INSERT INTO businesses (
-                    name, phone, category, address, city, state, zip_code,
-                    latitude, longitude, website, reviews, rating, source_url, metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                business_data.get('name'),
-                business_data.get('phone'),
-                business_data.get('category'),
-                business_data.get('address'),
-                business_data.get('city'),
-                business_data.get('state'),
-                business_data.get('zip_code'),
-                business_data.get('latitude'),
-                business_data.get('longitude'),
-                business_data.get('website'),
-                business_data.get('reviews'),
-                business_data.get('rating'),
-                business_data.get('source_url'),
-                metadata
-            ))
-            conn.commit()
+        return (
+            business_data.get('name'),
+            business_data.get('phone'),
+            business_data.get('category'),
+            business_data.get('address'),
+            business_data.get('city'),
+            business_data.get('state'),
+            business_data.get('zip_code'),
+            business_data.get('latitude'),
+            business_data.get('longitude'),
+            business_data.get('website'),
+            business_data.get('reviews'),
+            business_data.get('rating'),
+            business_data.get('source_url'),
+            metadata
+        )
+    
+    def add_business(self, business_data: Dict) -> int:
+        """Add a new business to the database"""
+        with self._connection() as conn:
+            cursor = conn.execute(f'''
+                INSERT INTO businesses ({BUSINESS_COLUMNS})
+                VALUES ({BUSINESS_PLACEHOLDERS})
+            ''', self._business_values(business_data))
             return cursor.lastrowid
     
+    def upsert_businesses(self, businesses: List[Dict], phone_index=None) -> List[str]:
+        """Insert new businesses and bump last_seen on known ones in one transaction
+        
+        Returns the phone numbers that were not in the database before.
+        Businesses without a phone number are skipped. When a PhoneIndex is
+        given, phones it already knows skip the existence query, and the new
+        phones are added to it.
+        """
+        # Keep the first occurrence of each phone on the page
+        unique = {}
+        for business in businesses:
+            phone = business.get('phone')
+            if phone and phone not in unique:
+                unique[phone] = business
+        
+        if not unique:
+            return []
+        
+        phones = list(unique)
+        if phone_index is not None:
+            existing = {phone for phone in phones if phone in phone_index}
+        else:
+            existing = set()
+        unknown = [phone for phone in phones if phone not in existing]
+        
+        with self._connection() as conn:
+            # Stay under SQLite's default host parameter limit
+            for start in range(0, len(unknown), 500):
+                chunk = unknown[start:start + 500]
+                placeholders = ','.join('?' for _ in chunk)
+                cursor = conn.execute(
+                    f'SELECT phone FROM businesses WHERE phone IN ({placeholders})',
+                    chunk
+                )
+                existing.update(row[0] for row in cursor)
+            
+            conn.executemany(f'''
+                INSERT INTO businesses ({BUSINESS_COLUMNS})
+                VALUES ({BUSINESS_PLACEHOLDERS})
+                ON CONFLICT(phone) DO UPDATE SET last_seen = CURRENT_TIMESTAMP
+            ''', [self._business_values(b) for b in unique.values()])
+        
+        new_phones = [phone for phone in phones if phone not in existing]
+        if phone_index is not None:
+            phone_index.update(new_phones)
+        return new_phones
+    
+    def bulk_import(self, businesses: Iterable[Dict], batch_size: int = 10000) -> Dict[str, int]:
+        """Merge imported businesses into the database in one transaction
+        
+        Rows are staged into a temp table, then merged with a single
+        INSERT ... SELECT: new phones are inserted (the first row wins when a
+        phone repeats) and phones already stored get last_seen bumped.
+        Returns counts of rows read, businesses inserted and rows that
+        matched an existing phone.
+        """
+        with self._connection() as conn:
+            conn.execute('DROP TABLE IF EXISTS temp.import_staging')
+            conn.execute(f'CREATE TEMP TABLE import_staging ({BUSINESS_COLUMNS})')
+            
+            rows = 0
+            batch = []
+            for business in businesses:
+                batch.append(self._business_values(business))
+                if len(batch) >= batch_size:
+                    conn.executemany(f'INSERT INTO import_staging VALUES ({BUSINESS_PLACEHOLDERS})', batch)
+                    rows += len(batch)
+                    batch = []
+            if batch:
+                conn.executemany(f'INSERT INTO import_staging VALUES ({BUSINESS_PLACEHOLDERS})', batch)
+                rows += len(batch)
+            
+            # ids only grow, so everything past the current maximum is new
+            last_id = conn.execute('SELECT COALESCE(MAX(id), 0) FROM businesses').fetchone()[0]
+            
+            # Phone order keeps the unique index writes sequential; rowid keeps
+            # the first row for a repeated phone. "WHERE true" lets SQLite parse
+            # the upsert clause after a SELECT.
+            conn.execute(f'''
+                INSERT INTO businesses ({BUSINESS_COLUMNS})
+                SELECT {BUSINESS_COLUMNS} FROM import_staging WHERE true ORDER BY phone, rowid
+                ON CONFLICT(phone) DO UPDATE SET last_seen = CURRENT_TIMESTAMP
+            ''')
+            
+            inserted = conn.execute('SELECT COUNT(*) FROM businesses WHERE id > ?', (last_id,)).fetchone()[0]
+            conn.execute('DROP TABLE temp.import_staging')
+        
+        return {'rows': rows, 'inserted': inserted, 'existing': rows - inserted}
+    
+    def iter_phones(self):
+        """Yield every stored phone number"""
+        with self._connection() as conn:
+            for (phone,) in conn.execute('SELECT phone FROM businesses WHERE phone IS NOT NULL'):
+                yield phone
+    
     def update_last_seen(self, phone: str):
         """Update the last_seen timestamp for a business"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute(
                 'UPDATE businesses SET last_seen = CURRENT_TIMESTAMP WHERE phone = ?',
                 (phone,)
             )
-            conn.commit()
+    
+    @staticmethod
+    def _business_from_row(row: sqlite3.Row) -> Dict:
+        """Convert a businesses row to a dict with parsed timestamps"""
+        business = dict(row)
+        if business.get('first_seen'):
+            business['first_seen'] = datetime.fromisoformat(business['first_seen'])
+        if business.get('last_seen'):
+            business['last_seen'] = datetime.fromisoformat(business['last_seen'])
+        return business
     
     def get_businesses_since_days(self, days: int) -> List[Dict]:
         """Get all businesses discovered in the last N days"""
+        return list(self.iter_businesses_since_days(days))
+    
+    def iter_businesses_since_days(self, days: int, chunk_size: int = 1000) -> Iterator[Dict]:
+        """Yield businesses discovered in the last N days, newest first
+        
+        Rows are fetched `chunk_size` at a time, so memory use does not grow
+        with the number of businesses. Exhaust or close the iterator before
+        writing through this Database on the same thread.
+        """
         since_date = datetime.now() - timedelta(days=days)
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._connection(sqlite3.Row) as conn:
             cursor = conn.execute('''
-                SELECT * FROM businesses 
-                WHERE first_seen >= ? 
+                SELECT * FROM businesses
+                WHERE first_seen >= ?
                 ORDER BY first_seen DESC
             ''', (since_date,))
             
-            rows = cursor.fetchall()
-            
-            # Convert to dict and parse dates
-            results = []
-            for row in rows:
-                business = dict(row)
-                # Parse timestamp strings to datetime objects
-                if business.get('first_seen'):
-                    business['first_seen'] = datetime.fromisoformat(business['first_seen'])
-                if business.get('last_seen'):
-                    business['last_seen'] = datetime.fromisoformat(business['last_seen'])
-                results.append(business)
-            
-            return results
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield self._business_from_row(row)
     
     def get_recent_businesses(self, limit: int = 10, offset: int = 0) -> List[Dict]:
         """Get the most recently discovered businesses"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._connection(sqlite3.Row) as conn:
             cursor = conn.execute('''
-                SELECT * FROM businesses 
-                ORDER BY first_seen DESC 
+                SELECT * FROM businesses
+                ORDER BY first_seen DESC
                 LIMIT ? OFFSET ?
             ''', (limit, offset))
             
-            rows = cursor.fetchall()
-            
-            # Convert to dict and parse dates
-            results = []
-            for row in rows:
-                business = dict(row)
-                # Parse timestamp strings to datetime objects
-                if business.get('first_seen'):
-                    business['first_seen'] = datetime.fromisoformat(business['first_seen'])
-                if business.get('last_seen'):
-                    business['last_seen'] = datetime.fromisoformat(business['last_seen'])
-                results.append(business)
-            
-            return results
+            return [self._business_from_row(row) for row in cursor.fetchall()]
+    
+    def get_businesses_page(self, limit: int = 100, cursor: Optional[str] = None,
+                            days: Optional[int] = None,
+                            category: Optional[str] = None,
+                            state: Optional[str] = None,
+                            city: Optional[str] = None,
+                            min_rating: Optional[float] = None,
+                            max_rating: Optional[float] = None,
+                            has_website: Optional[bool] = None,
+                            search: Optional[str] = None,
+                            sort: str = 'newest',
+                            offset: int = 0) -> Tuple[List[Dict], Optional[str]]:
+        """Get one filtered, sorted page of businesses with keyset pagination
+        
+        Pages are ordered by (sort key, id) and each page starts right after
+        the previous page's last row, so deep pages cost the same as the
+        first one. `search` matches words (as prefixes) in name, category and
+        address. Returns the page and the cursor for the next page (None on
+        the last page). Raises ValueError for an unknown sort key or a
+        cursor from a different sort.
+        
+        `offset` is deprecated and only kept for clients that predate
+        cursors: it skips that many rows of the same sorted query, at a cost
+        that grows with the offset.
+        """
+        if sort not in BUSINESS_SORTS:
+            raise ValueError(f"Unknown sort '{sort}', expected one of: {', '.join(BUSINESS_SORTS)}")
+        sort_expression, direction = BUSINESS_SORTS[sort]
+        
+        conditions = []
+        params = []
+        
+        if days:
+            conditions.append('first_seen >= ?')
+            params.append(datetime.now() - timedelta(days=days))
+        if category:
+            conditions.append('category = ?')
+            params.append(category)
+        if state:
+            conditions.append('state = ?')
+            params.append(state.upper())
+        if city:
+            conditions.append('city = ?')
+            params.append(city)
+        if min_rating is not None:
+            conditions.append('rating >= ?')
+            params.append(min_rating)
+        if max_rating is not None:
+            conditions.append('rating <= ?')
+            params.append(max_rating)
+        if has_website is not None:
+            conditions.append("IFNULL(website, '') != ''" if has_website else "IFNULL(website, '') = ''")
+        
+        if search and search.strip():
+            if self.fts_enabled:
+                match = fts_query(search)
+                if match:
+                    conditions.append('id IN (SELECT rowid FROM businesses_fts WHERE businesses_fts MATCH ?)')
+                    params.append(match)
+            else:
+                conditions.append('(name LIKE ? OR category LIKE ? OR address LIKE ?)')
+                params.extend([f'%{search.strip()}%'] * 3)
+        
+        if cursor:
+            # Spelled out rather than as a row value, which SQLite cannot
+            # seek an expression index on
+            comparison = '<' if direction == 'DESC' else '>'
+            conditions.append(
+                f'{sort_expression} {comparison}= ? AND ({sort_expression} {comparison} ? OR id {comparison} ?)'
+            )
+            value, business_id = decode_cursor(cursor, sort)
+            params.extend([value, value, business_id])
+        
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        
+        with self._connection(sqlite3.Row) as conn:
+            # One extra row tells whether there is a next page
+            rows = conn.execute(f'''
+                SELECT *, {sort_expression} AS sort_value FROM businesses
+                {where}
+                ORDER BY {sort_expression} {direction}, id {direction}
+                LIMIT ? OFFSET ?
+            ''', (*params, limit + 1, offset)).fetchall()
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(sort, rows[-1]['sort_value'], rows[-1]['id'])
+        
+        businesses = []
+        for row in rows:
+            business = self._business_from_row(row)
+            del business['sort_value']
+            businesses.append(business)
+        return businesses, next_cursor
     
     def get_statistics(self) -> Dict:
-        """Get database statistics"""
-        with sqlite3.connect(self.db_path) as conn:
-            # Total businesses
-            total = conn.execute('SELECT COUNT(*) FROM businesses').fetchone()[0]
-            
-            # New this week
-            week_ago = datetime.now() - timedelta(days=7)
-            new_week = conn.execute(
-                'SELECT COUNT(*) FROM businesses WHERE first_seen >= ?',
-                (week_ago,)
+        """Get database statistics from the rollup tables
+        
+        Weekly and monthly counts go by whole days: everything first seen on
+        or after the date 7 (30) days ago.
+        """
+        week_ago = (datetime.now() - timedelta(days=7)).date().isoformat()
+        month_ago = (datetime.now() - timedelta(days=30)).date().isoformat()
+        
+        with self._connection() as conn:
+            # Total businesses (one row per state)
+            total = conn.execute(
+                'SELECT COALESCE(SUM(businesses), 0) FROM state_business_counts'
             ).fetchone()[0]
             
-            # New this month
-            month_ago = datetime.now() - timedelta(days=30)
-            new_month = conn.execute(
-                'SELECT COUNT(*) FROM businesses WHERE first_seen >= ?',
-                (month_ago,)
-            ).fetchone()[0]
+            # New this week and month (at most 31 daily rows)
+            new_week, new_month = conn.execute('''
+                SELECT COALESCE(SUM(CASE WHEN day >= ? THEN businesses END), 0),
+                       COALESCE(SUM(businesses), 0)
+                FROM daily_business_counts
+                WHERE day >= ?
+            ''', (week_ago, month_ago)).fetchone()
             
             # Categories count
             categories = conn.execute(
-                'SELECT COUNT(DISTINCT category) FROM businesses'
+                "SELECT COUNT(*) FROM category_business_counts WHERE businesses > 0 AND category != ''"
             ).fetchone()[0]
             
             return {
@@ -225,11 +678,29 @@ class Database:
                 'categories_count': categories
             }
     
+    def get_category_counts(self) -> Dict[str, int]:
+        """Number of businesses per category, largest first"""
+        with self._connection() as conn:
+            return dict(conn.execute('''
+                SELECT category, businesses FROM category_business_counts
+                WHERE businesses > 0 AND category != ''
+                ORDER BY businesses DESC
+            ''').fetchall())
+    
+    def get_state_counts(self) -> Dict[str, int]:
+        """Number of businesses per state, largest first"""
+        with self._connection() as conn:
+            return dict(conn.execute('''
+                SELECT state, businesses FROM state_business_counts
+                WHERE businesses > 0 AND state != ''
+                ORDER BY businesses DESC
+            ''').fetchall())
+    
     def add_scan_record(self, categories: List[str], locations: Dict, 
                        businesses_found: int, new_businesses: int, 
                        duration_seconds: int):
         """Record a scan in history"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute('''
                 INSERT INTO scan_history (
                     categories, locations, businesses_found, 
@@ -242,40 +713,131 @@ class Database:
                 new_businesses,
                 duration_seconds
             ))
-            conn.commit()
+    
+    def get_location_history(self, category: str) -> Dict[str, Dict]:
+        """Get scan history for every location of a category, keyed by location key"""
+        with self._connection(sqlite3.Row) as conn:
+            cursor = conn.execute(
+                '''SELECT location_key, scans, avg_new, churn, empty_streak, total_new, last_scanned
+                   FROM location_history WHERE category = ?''',
+                (category,)
+            )
+            
+            history = {}
+            for row in cursor:
+                entry = dict(row)
+                if entry.get('last_scanned'):
+                    entry['last_scanned'] = datetime.fromisoformat(entry['last_scanned'])
+                history[entry.pop('location_key')] = entry
+            
+            return history
+    
+    def save_location_history(self, category: str, location_key: str, entry: Dict):
+        """Store the scan history of one location"""
+        last_scanned = entry.get('last_scanned')
+        if isinstance(last_scanned, datetime):
+            last_scanned = last_scanned.isoformat(sep=' ')
+        
+        with self._connection() as conn:
+            conn.execute('''
+                INSERT OR REPLACE INTO location_history (
+                    category, location_key, scans, avg_new, churn,
+                    empty_streak, total_new, last_scanned
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                category,
+                location_key,
+                entry['scans'],
+                entry['avg_new'],
+                entry['churn'],
+                entry['empty_streak'],
+                entry['total_new'],
+                last_scanned
+            ))
+    
+    def start_scan_cycle(self, mode: str, category: str, locations: Dict,
+                         location_keys: List[str]) -> int:
+        """Create a checkpoint for a new scan cycle with every location pending"""
+        with self._connection() as conn:
+            cursor = conn.execute(
+                'INSERT INTO scan_cycles (mode, category, locations) VALUES (?, ?, ?)',
+                (mode, category, json.dumps(locations, sort_keys=True))
+            )
+            cycle_id = cursor.lastrowid
+            conn.executemany(
+                'INSERT OR IGNORE INTO scan_cycle_locations (cycle_id, location_key) VALUES (?, ?)',
+                [(cycle_id, key) for key in location_keys]
+            )
+            return cycle_id
+    
+    def get_open_scan_cycle(self, mode: str, category: str, locations: Dict) -> Optional[int]:
+        """Get the most recent unfinished cycle for the same scan settings, if any"""
+        with self._connection() as conn:
+            row = conn.execute('''
+                SELECT id FROM scan_cycles
+                WHERE mode = ? AND category = ? AND locations = ? AND completed_at IS NULL
+                ORDER BY id DESC LIMIT 1
+            ''', (mode, category, json.dumps(locations, sort_keys=True))).fetchone()
+            return row[0] if row else None
+    
+    def get_scan_cycle_remaining(self, cycle_id: int, max_attempts: Optional[int] = None) -> List[str]:
+        """Location keys in a cycle that are not done (pending, in flight or failed)
+        
+        With max_attempts, failed locations already attempted that many
+        times are left out.
+        """
+        with self._connection() as conn:
+            cursor = conn.execute(
+                """SELECT location_key FROM scan_cycle_locations
+                   WHERE cycle_id = ? AND status != 'done'
+                     AND NOT (status = 'failed' AND attempts >= IFNULL(?, attempts + 1))""",
+                (cycle_id, max_attempts)
+            )
+            return [row[0] for row in cursor]
+    
+    def set_scan_cycle_location_status(self, cycle_id: int, location_key: str,
+                                       status: str, error: Optional[str] = None):
+        """Mark a location in a cycle as in_flight, done or failed"""
+        with self._connection() as conn:
+            conn.execute('''
+                UPDATE scan_cycle_locations
+                SET status = ?, error = ?, updated_at = CURRENT_TIMESTAMP,
+                    attempts = attempts + (CASE WHEN ? = 'in_flight' THEN 1 ELSE 0 END)
+                WHERE cycle_id = ? AND location_key = ?
+            ''', (status, error, status, cycle_id, location_key))
+    
+    def get_scan_cycle_progress(self, cycle_id: int) -> Dict[str, int]:
+        """Count the locations of a cycle by status"""
+        with self._connection() as conn:
+            cursor = conn.execute(
+                'SELECT status, COUNT(*) FROM scan_cycle_locations WHERE cycle_id = ? GROUP BY status',
+                (cycle_id,)
+            )
+            return dict(cursor.fetchall())
+    
+    def complete_scan_cycle(self, cycle_id: int):
+        """Close a cycle so it is no longer resumed
+        
+        Its location checkpoints are deleted and only the latest
+        COMPLETED_SCAN_CYCLES_KEPT completed cycles are kept, so the tables
+        stay small however many cycles a continuous scan runs.
+        """
+        with self._connection() as conn:
+            conn.execute(
+                'UPDATE scan_cycles SET completed_at = CURRENT_TIMESTAMP WHERE id = ?',
+                (cycle_id,)
+            )
+            conn.execute('DELETE FROM scan_cycle_locations WHERE cycle_id = ?', (cycle_id,))
+            conn.execute('''
+                DELETE FROM scan_cycles
+                WHERE completed_at IS NOT NULL AND id NOT IN (
+                    SELECT id FROM scan_cycles WHERE completed_at IS NOT NULL
+                    ORDER BY id DESC LIMIT ?
+                )
+            ''', (COMPLETED_SCAN_CYCLES_KEPT,))
     
     def get_locations_for_filters(self, states: Optional[List[str]] = None,
                                  cities: Optional[List[str]] = None,
                                  min_population: int = 0) -> List[Dict]:
         """Get locations matching the specified filters"""
-        locations_db = Path(__file__).parent.parent / 'data' / 'locations.db'
-        
-        if not locations_db.exists():
-            # Fallback to some default locations
-            return [
-                {'city': 'New York', 'state': 'NY', 'lat': 40.7128, 'lng': -74.0060},
-                {'city': 'Los Angeles', 'state': 'CA', 'lat': 34.0522, 'lng': -118.2437},
-                {'city': 'Chicago', 'state': 'IL', 'lat': 41.8781, 'lng': -87.6298},
-            ]
-        
-        with sqlite3.connect(locations_db) as conn:
-            conn.row_factory = sqlite3.Row
-            
-            # Build query
-            query = 'SELECT * FROM locations WHERE population >= ?'
-            params = [min_population]
-            
-            if states:
-                placeholders = ','.join(['?' for _ in states])
-                query += f' AND state IN ({placeholders})'
-                params.extend(states)
-            
-            if cities:
-                placeholders = ','.join(['?' for _ in cities])
-                query += f' AND city IN ({placeholders})'
-                params.extend(cities)
-            
-            query += ' ORDER BY population DESC'
-            
-            cursor = conn.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+        return filter_locations(states=states, cities=cities, min_population=min_population)
@@ -0,0 +1,132 @@
+"""
+Background database writer for MapLeads
+Scraping threads hand parsed pages to a single writer thread that
+group-commits them, so browsers never wait on disk
+"""
+
+import queue
+import threading
+from typing import Callable, Dict, List, Optional
+
+from .database import Database
+
+# Marks the end of the queue when the writer is stopped
+_STOP = object()
+
+class DatabaseWriter:
+    """Single thread that drains a bounded queue of business batches.
+    
+    Each queued batch is one scraped page. The writer combines whatever is
+    waiting (up to max_group batches) into one upsert transaction, then calls
+    each batch's callback with the phones that were new. If the group fails,
+    its batches are retried one at a time and any batch that still fails gets
+    its on_error callback instead. A full queue blocks submit(), which keeps
+    scrapers from outrunning the disk. Once stop() is called, submit()
+    raises instead of queueing pages nothing would save.
+    """
+    
+    def __init__(self, database: Database, phone_index=None,
+                 max_queue: int = 64, max_group: int = 32):
+        """Initialize the writer (call start() to launch the thread)"""
+        self.db = database
+        self.phone_index = phone_index
+        self.max_group = max_group
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._thread = None
+        self._closed = False
+        # Held while queueing, so no page can be queued behind the stop marker
+        self._submit_lock = threading.Lock()
+    
+    def start(self):
+        """Launch the writer thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='mapleads-db-writer', daemon=True)
+            self._thread.start()
+    
+    def submit(self, businesses: List[Dict], callback: Optional[Callable[[List[str]], None]] = None,
+               on_error: Optional[Callable[[Exception], None]] = None):
+        """Queue a page of businesses, blocking while the queue is full"""
+        with self._submit_lock:
+            if self._closed:
+                raise RuntimeError("DatabaseWriter has been stopped")
+            if self._thread is None:
+                raise RuntimeError("DatabaseWriter has not been started")
+            self._queue.put((businesses, callback, on_error))
+    
+    def flush(self):
+        """Block until every submitted batch has been committed"""
+        self._queue.join()
+    
+    def stop(self):
+        """Commit everything still queued, then stop the writer thread"""
+        with self._submit_lock:
+            if self._closed or self._thread is None:
+                self._closed = True
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+    
+    def _run(self):
+        """Writer loop: wait for a batch, group with any others waiting, commit"""
+        while True:
+            item = self._queue.get()
+            group = [item]
+            
+            # Gather whatever else is already waiting
+            while item is not _STOP and len(group) < self.max_group:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                group.append(item)
+            
+            batches = [entry for entry in group if entry is not _STOP]
+            try:
+                if batches:
+                    self._write_group(batches)
+            finally:
+                for _ in group:
+                    self._queue.task_done()
+            
+            if group[-1] is _STOP:
+                break
+    
+    def _write_group(self, batches: List):
+        """Upsert several batches in one transaction and notify their callbacks"""
+        combined = [business for businesses, _, _ in batches for business in businesses]
+        
+        try:
+            new_phones = set(self.db.upsert_businesses(combined, self.phone_index))
+        except Exception as e:
+            if len(batches) > 1:
+                # Retry page by page so one bad page doesn't lose the others
+                print(f"⚠️  Database writer failed to save {len(batches)} pages together, retrying one by one: {e}")
+                for batch in batches:
+                    self._write_group([batch])
+                return
+            
+            print(f"❌ Database writer failed to save {len(combined)} businesses: {e}")
+            on_error = batches[0][2]
+            if on_error:
+                try:
+                    on_error(e)
+                except Exception as callback_error:
+                    print(f"❌ Database writer error callback error: {callback_error}")
+            return
+        
+        # A phone is credited as new to the first batch that contained it
+        for businesses, callback, _ in batches:
+            batch_new = []
+            for business in businesses:
+                phone = business.get('phone')
+                if phone in new_phones:
+                    batch_new.append(phone)
+                    new_phones.discard(phone)
+            
+            if callback:
+                try:
+                    callback(batch_new)
+                except Exception as e:
+                    print(f"❌ Database writer callback error: {e}")
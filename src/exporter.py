@@ -3,48 +3,371 @@ Export functionality for MapLeads
 Handles exporting data to various formats
 """
 
+import csv
 import json
-import pandas as pd
-from typing import List, Dict, Tuple
+import re
+from itertools import chain, islice
+from typing import Iterable, Iterator, List, Dict, Tuple
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime
 
-def export_businesses(businesses: List[Dict], output_path: str, format: str):
-    """Export businesses to specified format"""
+# Columns kept out of exported files
+EXCLUDED_COLUMNS = {'metadata'}
+
+# Rows inspected to size xlsx columns before the first row is written
+XLSX_WIDTH_SAMPLE = 1000
+XLSX_MAX_WIDTH = 50
+
+# Rows per Parquet row group / Arrow record batch
+ARROW_BATCH_SIZE = 100000
+
+# Arrow types for the businesses columns; anything else is exported as a string
+ARROW_COLUMN_TYPES = {
+    'id': 'int64',
+    'latitude': 'float64',
+    'longitude': 'float64',
+    'rating': 'float64',
+    'first_seen': 'timestamp[us]',
+    'last_seen': 'timestamp[us]',
+}
+
+def _to_datetime(value) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value))
+
+# Python conversion for each typed Arrow column
+ARROW_CONVERTERS = {
+    'int64': int,
+    'float64': float,
+    'timestamp[us]': _to_datetime,
+}
+
+def _json_default(value):
+    """Serialize timestamps in JSON exports as ISO 8601"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _export_csv(rows: Iterator[Dict], columns: List[str], output_path: Path) -> int:
+    count = 0
+    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
+        if columns:
+            writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+def _export_json(rows: Iterator[Dict], columns: List[str], output_path: Path) -> int:
+    """JSON array with one record per line, written as rows arrive"""
+    count = 0
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write('[')
+        for row in rows:
+            f.write(',\n  ' if count else '\n  ')
+            f.write(json.dumps({column: row.get(column) for column in columns}, default=_json_default))
+            count += 1
+        f.write('\n]\n' if count else ']\n')
+    return count
+
+def _export_jsonl(rows: Iterator[Dict], columns: List[str], output_path: Path) -> int:
+    """Newline-delimited JSON, one record per line"""
+    count = 0
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for row in rows:
+            f.write(json.dumps({column: row.get(column) for column in columns}, default=_json_default))
+            f.write('\n')
+            count += 1
+    return count
+
+def _export_xlsx(rows: Iterator[Dict], columns: List[str], output_path: Path) -> int:
+    """Excel workbook written in openpyxl's write-only mode"""
+    from openpyxl import Workbook
+    from openpyxl.utils import get_column_letter
+    
+    # Write-only sheets need column widths before any row, so size them
+    # from a bounded sample of leading rows
+    sample = list(islice(rows, XLSX_WIDTH_SAMPLE))
+    widths = [len(column) for column in columns]
+    for row in sample:
+        for i, column in enumerate(columns):
+            value = row.get(column)
+            if value is not None:
+                widths[i] = max(widths[i], len(str(value)))
     
-    # Convert to DataFrame for easier manipulation
-    df = pd.DataFrame(businesses)
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet('Businesses')
+    for i, width in enumerate(widths, start=1):
+        worksheet.column_dimensions[get_column_letter(i)].width = min(width + 2, XLSX_MAX_WIDTH)
     
-    # Clean up data for export
-    if 'metadata' in df.columns:
-        # Extract useful info from metadata if present
-        df.drop('metadata', axis=1, inplace=True)
+    worksheet.append(columns)
+    count = 0
+    for row in chain(sample, rows):
+        worksheet.append([row.get(column) for column in columns])
+        count += 1
+    
+    workbook.save(output_path)
+    return count
+
+def _require_pyarrow():
+    """Import pyarrow, which is only needed for the columnar formats"""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Parquet and Feather support requires pyarrow: pip install pyarrow")
+    return pyarrow
+
+def _arrow_value(value, convert):
+    """`value` converted for a typed Arrow column, None if it cannot be"""
+    if value is None:
+        return None
+    try:
+        return convert(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+def _arrow_batches(rows: Iterator[Dict], columns: List[str]):
+    """Arrow schema for `columns` and a generator of record batches of `rows`"""
+    pa = _require_pyarrow()
+    schema = pa.schema([
+        (column, pa.type_for_alias(ARROW_COLUMN_TYPES.get(column, 'string')))
+        for column in columns
+    ])
+    typed = {
+        column: ARROW_CONVERTERS[ARROW_COLUMN_TYPES[column]]
+        for column in columns if column in ARROW_COLUMN_TYPES
+    }
+    
+    def batches():
+        while True:
+            chunk = list(islice(rows, ARROW_BATCH_SIZE))
+            if not chunk:
+                return
+            try:
+                yield pa.RecordBatch.from_pylist(chunk, schema=schema)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, OverflowError):
+                # Some row holds a value its column's type can't take, e.g. an
+                # imported latitude of 'N/A'; export those values as null
+                for row in chunk:
+                    for column, convert in typed.items():
+                        row[column] = _arrow_value(row.get(column), convert)
+                yield pa.RecordBatch.from_pylist(chunk, schema=schema)
+    
+    return schema, batches()
+
+def _export_parquet(rows: Iterator[Dict], columns: List[str], output_path: Path) -> int:
+    """Parquet file written one row group per batch"""
+    import pyarrow.parquet as pq
+    
+    schema, batches = _arrow_batches(rows, columns)
+    count = 0
+    with pq.ParquetWriter(output_path, schema, compression='zstd') as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+            count += batch.num_rows
+    return count
+
+def _export_feather(rows: Iterator[Dict], columns: List[str], output_path: Path) -> int:
+    """Feather (Arrow IPC file) written one record batch at a time"""
+    schema, batches = _arrow_batches(rows, columns)
+    pa = _require_pyarrow()
+    options = pa.ipc.IpcWriteOptions(compression='lz4')
+    count = 0
+    with pa.ipc.new_file(output_path, schema, options=options) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+            count += batch.num_rows
+    return count
+
+EXPORT_WRITERS = {
+    'csv': _export_csv,
+    'json': _export_json,
+    'jsonl': _export_jsonl,
+    'xlsx': _export_xlsx,
+    'parquet': _export_parquet,
+    'feather': _export_feather,
+}
+
+def export_businesses(businesses: Iterable[Dict], output_path: str, format: str) -> int:
+    """Export businesses to specified format, returning how many were written
+    
+    Rows are written one at a time as they are read from `businesses`
+    (e.g. Database.iter_businesses_since_days), so memory use stays flat
+    however many businesses are exported. Columns come from the first row.
+    """
+    if format not in EXPORT_WRITERS:
+        raise ValueError(f"Unsupported format: {format}")
     
     # Ensure path
     output_path = Path(output_path)
     
-    if format == 'csv':
-        df.to_csv(output_path, index=False)
+    rows = iter(businesses)
+    first = next(rows, None)
+    if first is None:
+        columns = []
+    else:
+        columns = [column for column in first if column not in EXCLUDED_COLUMNS]
+        rows = chain([first], rows)
     
-    elif format == 'json':
-        df.to_json(output_path, orient='records', indent=2)
+    return EXPORT_WRITERS[format](rows, columns, output_path)
+
+# Rows read, validated and committed at a time by streaming imports
+IMPORT_CHUNK_SIZE = 20000
+
+# Bytes read at a time when streaming a JSON array
+JSON_READ_SIZE = 1 << 20
+
+_JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+def _iter_json_array(f, read_size: int = JSON_READ_SIZE) -> Iterator:
+    """Yield the elements of a JSON array one at a time, `f` positioned just past the '['"""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    eof = False
+    state = 'first'
     
-    elif format == 'xlsx':
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Businesses', index=False)
-            
-            # Auto-adjust column widths
-            worksheet = writer.sheets['Businesses']
-            for column in df:
-                column_width = max(df[column].astype(str).map(len).max(), len(column))
-                col_idx = df.columns.get_loc(column)
-                worksheet.column_dimensions[chr(65 + col_idx)].width = min(column_width + 2, 50)
+    while True:
+        pos = _JSON_WHITESPACE.match(buffer, pos).end()
+        need_more = pos == len(buffer)
+        
+        if not need_more:
+            char = buffer[pos]
+            if char == ']' and state != 'value':
+                # Like json.load, allow nothing but whitespace after the array
+                rest = buffer[pos + 1:]
+                while True:
+                    if not _JSON_WHITESPACE.fullmatch(rest):
+                        raise ValueError("Invalid JSON: unexpected content after array")
+                    if eof:
+                        return
+                    rest = f.read(read_size)
+                    eof = not rest
+            if state == 'separator':
+                if char != ',':
+                    raise ValueError(f"Invalid JSON: expected ',' or ']' in array, found {char!r}")
+                pos += 1
+                state = 'value'
+                continue
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+                # A number cut off by the end of the buffer ("1e" of "1e-07") still
+                # decodes, so only trust a value once the ',' or ']' after it is read
+                after = _JSON_WHITESPACE.match(buffer, end).end()
+                need_more = not eof and (after == len(buffer) or buffer[after] not in ',]')
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                need_more = True
+            if not need_more:
+                yield value
+                pos = end
+                state = 'separator'
+                continue
+        
+        if eof:
+            raise ValueError("Invalid JSON: unterminated array")
+        chunk = f.read(read_size)
+        eof = not chunk
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+def _frames(records: Iterator[Dict], chunk_size: int):
+    """DataFrames of up to `chunk_size` records"""
+    import pandas as pd
     
-    else:
-        raise ValueError(f"Unsupported format: {format}")
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            return
+        yield pd.DataFrame(chunk)
 
-def import_businesses(input_path: str) -> Tuple[List[Dict], List[str]]:
-    """Import businesses from file and return (businesses, validation_errors)"""
+def _read_json_chunks(input_path: Path, chunk_size: int):
+    import pandas as pd
+    
+    with open(input_path, 'r', encoding='utf-8-sig') as f:
+        # Arrays of records are streamed; any other document is loaded whole
+        first = f.read(1)
+        while first.isspace():
+            first = f.read(1)
+        if first == '[':
+            yield from _frames(_iter_json_array(f), chunk_size)
+        else:
+            yield pd.DataFrame(json.loads(first + f.read()))
+
+def _read_jsonl_chunks(input_path: Path, chunk_size: int):
+    with open(input_path, 'r', encoding='utf-8-sig') as f:
+        yield from _frames((json.loads(line) for line in f if line.strip()), chunk_size)
+
+def _read_xlsx_chunks(input_path: Path, chunk_size: int):
+    """First worksheet in openpyxl's read-only mode, header from the first row"""
+    import pandas as pd
+    from openpyxl import load_workbook
+    
+    workbook = load_workbook(input_path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = [f"Unnamed: {i}" if name is None else name for i, name in enumerate(header)]
+        # Read-only rows stop at their last filled cell, so pad them to the header
+        width = len(columns)
+        rows = (row[:width] + (None,) * (width - len(row))
+                for row in rows if any(value is not None for value in row))
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return
+            yield pd.DataFrame(chunk, columns=columns)
+    finally:
+        workbook.close()
+
+def _read_parquet_chunks(input_path: Path, chunk_size: int):
+    _require_pyarrow()
+    import pyarrow.parquet as pq
+    
+    for batch in pq.ParquetFile(input_path).iter_batches(batch_size=chunk_size):
+        yield batch.to_pandas()
+
+def _read_feather_chunks(input_path: Path, chunk_size: int):
+    pa = _require_pyarrow()
+    
+    with pa.memory_map(str(input_path)) as source:
+        reader = pa.ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            for offset in range(0, batch.num_rows, chunk_size):
+                yield batch.slice(offset, chunk_size).to_pandas()
+
+def _read_csv_chunks(input_path: Path, chunk_size: int):
+    import pandas as pd
+    
+    # Chunks infer types separately, so keep phones as text rather than let a
+    # chunk of bare digits with one blank turn them into floats
+    with pd.read_csv(input_path, chunksize=chunk_size, dtype={'phone': str}) as reader:
+        yield from reader
+
+IMPORT_READERS = {
+    '.csv': _read_csv_chunks,
+    '.json': _read_json_chunks,
+    '.jsonl': _read_jsonl_chunks,
+    '.ndjson': _read_jsonl_chunks,
+    '.xlsx': _read_xlsx_chunks,
+    '.parquet': _read_parquet_chunks,
+    '.feather': _read_feather_chunks,
+    '.arrow': _read_feather_chunks,
+}
+
+def iter_import_businesses(input_path: str, chunk_size: int = IMPORT_CHUNK_SIZE) -> Iterator[Tuple[List[Dict], List[str], int]]:
+    """Read and validate an import file a chunk at a time
+    
+    Yields (valid_businesses, validation_errors, rows_read) per chunk of at
+    most `chunk_size` rows, so files larger than memory can be imported.
+    Error row numbers count from the start of the file.
+    """
     input_path = Path(input_path)
     
     if not input_path.exists():
@@ -52,81 +375,166 @@ def import_businesses(input_path: str) -> Tuple[List[Dict], List[str]]:
     
     # Determine format from extension
     extension = input_path.suffix.lower()
-    
-    if extension == '.csv':
-        df = pd.read_csv(input_path)
-    elif extension == '.json':
-        with open(input_path, 'r') as f:
-            data = json.load(f)
-        df = pd.DataFrame(data)
-    elif extension == '.xlsx':
-        df = pd.read_excel(input_path)
-    else:
+    if extension not in IMPORT_READERS:
         raise ValueError(f"Unsupported import format: {extension}")
     
-    # Convert to list of dictionaries
-    businesses = df.to_dict('records')
+    rows_read = 0
+    for df in IMPORT_READERS[extension](input_path, chunk_size):
+        valid_businesses, errors = validate_import_data(df, first_row=rows_read + 1)
+        rows_read += len(df)
+        yield valid_businesses, errors, len(df)
+
+def import_businesses(input_path: str) -> Tuple[List[Dict], List[str]]:
+    """Import businesses from file and return (businesses, validation_errors)"""
+    businesses = []
+    errors = []
+    for valid_businesses, chunk_errors, _ in iter_import_businesses(input_path):
+        businesses.extend(valid_businesses)
+        errors.extend(chunk_errors)
+    return businesses, errors
+
+# Field rules applied by validate_import_data
+REQUIRED_IMPORT_FIELDS = ['name', 'phone', 'category']
+OPTIONAL_IMPORT_FIELDS = ['reviews', 'rating', 'website', 'city', 'state', 'zip_code', 'latitude', 'longitude']
+STRIPPED_IMPORT_FIELDS = ['name', 'category', 'city', 'state']
+
+def _is_str_dtype(column) -> bool:
+    """Whether a column uses pandas' string dtype with NaN for missing values (the pandas 3 default)"""
+    import pandas as pd
+    return isinstance(column.dtype, pd.StringDtype) and column.dtype.na_value is not pd.NA
+
+def _nan_backed(column):
+    """Column of a nullable extension dtype (string, Int64, Float64, boolean) as
+    objects with NaN for missing values; pd.NA can't be truth-tested"""
+    import pandas as pd
+    if getattr(column.dtype, 'na_value', None) is not pd.NA:
+        return column
+    return column.astype(object).where(column.notna(), float('nan'))
+
+def _truthy(column):
+    """Elementwise bool(value), i.e. what `if value:` sees for each row"""
+    import pandas as pd
+    # NaN counts as truthy, as it does in Python
+    if _is_str_dtype(column):
+        return column.isna() | (column.str.len() > 0)
+    if pd.api.types.is_bool_dtype(column):
+        return column.copy()
+    if pd.api.types.is_numeric_dtype(column):
+        return column.isna() | (column != 0)
+    # numpy truth-tests each object as Python does; pandas' astype(bool) treats NaN as False
+    return pd.Series(column.to_numpy(dtype=object).astype(bool), index=column.index)
+
+def _to_str(column):
+    """str(value) for each row, as a string Series even when empty"""
+    if _is_str_dtype(column):
+        return column.fillna(str(float('nan')))
+    return column.map(str).astype(object)
+
+def _records(df) -> List[Dict]:
+    """DataFrame rows as dicts of plain Python values; much faster than to_dict('records')"""
+    names = list(df.columns)
+    return [dict(zip(names, row)) for row in zip(*(df[name].tolist() for name in names))]
+
+def _float_or_none(value):
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+def validate_import_data(businesses, first_row: int = 1) -> Tuple[List[Dict], List[str]]:
+    """Validate imported business data and return (valid_businesses, errors)
+    
+    `businesses` is a list of dicts or a DataFrame read from an import
+    file; error messages number its rows from `first_row`. Each rule runs
+    as a whole-column operation; only rows that fail a check get an error
+    message built for them.
+    """
+    import pandas as pd
     
-    # Validate and clean the data
-    validated_businesses, errors = validate_import_data(businesses)
+    df = pd.DataFrame(businesses).reset_index(drop=True)
+    if df.empty:
+        return [], []
+    for field in df.columns:
+        df[field] = _nan_backed(df[field])
     
-    return validated_businesses, errors
-
-def validate_import_data(businesses: List[Dict]) -> Tuple[List[Dict], List[str]]:
-    """Validate imported business data and return (valid_businesses, errors)"""
-    required_fields = ['name', 'phone', 'category']
-    optional_fields = ['reviews', 'rating', 'website', 'city', 'state', 'zip_code', 'latitude', 'longitude']
+    # One Series per check, holding the row's message or None
+    checks = []
     
-    valid_businesses = []
-    errors = []
+    def report(mask, message):
+        messages = pd.Series(None, index=df.index, dtype=object)
+        messages.loc[mask.index[mask]] = message if isinstance(message, str) else message[mask]
+        checks.append(messages)
     
-    for i, business in enumerate(businesses):
-        row_errors = []
-        
-        # Check required fields
-        for field in required_fields:
-            if field not in business or not business[field] or pd.isna(business[field]):
-                row_errors.append(f"Missing required field: {field}")
-        
-        # Validate phone number format
-        if 'phone' in business and business['phone']:
-            phone = str(business['phone']).strip()
-            # Remove formatting characters
-            clean_phone = ''.join(filter(str.isdigit, phone))
-            if len(clean_phone) != 10:
-                row_errors.append(f"Invalid phone number format: {phone}")
-            else:
-                business['phone'] = clean_phone
-        
-        # Validate rating if present
-        if 'rating' in business and business['rating'] and not pd.isna(business['rating']):
-            try:
-                rating = float(business['rating'])
-                if not (0 <= rating <= 5):
-                    row_errors.append(f"Rating must be between 0-5: {rating}")
-                else:
-                    business['rating'] = rating
-            except (ValueError, TypeError):
-                row_errors.append(f"Invalid rating format: {business['rating']}")
-                business['rating'] = None
-        
-        # Clean string fields
-        for field in ['name', 'category', 'city', 'state']:
-            if field in business and business[field] and not pd.isna(business[field]):
-                business[field] = str(business[field]).strip()
-        
-        # Set default values for missing optional fields
-        for field in optional_fields:
-            if field not in business or pd.isna(business[field]):
-                business[field] = None
-        
-        # Add metadata
-        business['imported_at'] = datetime.now().isoformat()
-        business['source'] = 'import'
-        
-        if row_errors:
-            errors.append(f"Row {i+1}: {'; '.join(row_errors)}")
+    # Check required fields
+    for field in REQUIRED_IMPORT_FIELDS:
+        if field in df:
+            missing = ~_truthy(df[field]) | df[field].isna()
+        else:
+            missing = pd.Series(True, index=df.index)
+        report(missing, f"Missing required field: {field}")
+    
+    # Validate phone number format
+    if 'phone' in df:
+        has_phone = _truthy(df['phone'])
+        # Dicts without a phone key get only the missing field error
+        if isinstance(businesses, list) and df['phone'].isna().any():
+            has_phone &= pd.Series(['phone' in business for business in businesses], index=df.index)
+        phone = _to_str(df['phone'][has_phone]).str.strip()
+        # Remove formatting characters
+        clean_phone = phone.str.replace(r'[^0-9]', '', regex=True)
+        # str.isdigit also counts non-ASCII digits, so those rare values take the slow path
+        non_ascii = phone.str.contains(r'[^\x00-\x7f]', regex=True)
+        if non_ascii.any():
+            clean_phone.loc[non_ascii] = phone[non_ascii].map(lambda value: ''.join(filter(str.isdigit, value)))
+        invalid = clean_phone.str.len() != 10
+        report(invalid, 'Invalid phone number format: ' + phone)
+        if not _is_str_dtype(df['phone']):
+            df['phone'] = df['phone'].astype(object)
+        df.loc[invalid.index[~invalid], 'phone'] = clean_phone[~invalid]
+    
+    # Validate rating if present
+    if 'rating' in df:
+        ratings = df['rating'][_truthy(df['rating']) & df['rating'].notna()]
+        if pd.api.types.is_numeric_dtype(ratings):
+            numbers = ratings.astype(float)
+            bad_format = pd.Series(False, index=ratings.index)
         else:
-            valid_businesses.append(business)
+            converted = [_float_or_none(value) for value in ratings]
+            bad_format = pd.Series([value is None for value in converted], index=ratings.index)
+            numbers = pd.Series([float('nan') if value is None else value for value in converted],
+                                index=ratings.index, dtype=float)
+        out_of_range = ~numbers.between(0, 5) & ~bad_format
+        report(out_of_range, 'Rating must be between 0-5: ' + _to_str(numbers))
+        report(bad_format, 'Invalid rating format: ' + _to_str(ratings))
+        in_range = ~out_of_range & ~bad_format
+        df['rating'] = df['rating'].astype(object)
+        df.loc[in_range.index[in_range], 'rating'] = numbers[in_range]
+        df.loc[bad_format.index[bad_format], 'rating'] = None
+    
+    # Clean string fields
+    for field in STRIPPED_IMPORT_FIELDS:
+        if field in df:
+            present = _truthy(df[field]) & df[field].notna()
+            if not _is_str_dtype(df[field]):
+                df[field] = df[field].astype(object)
+            df.loc[present, field] = _to_str(df.loc[present, field]).str.strip()
+    
+    # Set default values for missing optional fields
+    for field in OPTIONAL_IMPORT_FIELDS:
+        if field in df:
+            df[field] = df[field].astype(object).where(df[field].notna(), None)
+        else:
+            df[field] = None
+    
+    # Add metadata
+    df['imported_at'] = datetime.now().isoformat()
+    df['source'] = 'import'
+    
+    failures = pd.concat(checks, axis=1)
+    has_errors = failures.notna().any(axis=1)
+    errors = [
+        f"Row {i + first_row}: {'; '.join(message for message in messages if isinstance(message, str))}"
+        for i, messages in zip(failures.index[has_errors], failures[has_errors].itertuples(index=False))
+    ]
     
-    return valid_businesses, errors
+    return _records(df[~has_errors]), errors
@@ -0,0 +1,154 @@
+"""
+Location index for MapLeads
+Compact prebuilt binary of US ZIP code centroids, loaded without pandas
+"""
+
+import csv
+import struct
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+DATA_DIR = Path(__file__).parent.parent / 'data'
+ZIP_CSV_PATH = DATA_DIR / 'uszips.csv'
+LOCATION_INDEX_PATH = DATA_DIR / 'locations.bin'
+
+# File layout (little endian):
+#   header   magic, record count, string count
+#   strings  uint16 length + UTF-8 bytes, repeated (city, state, state name, county)
+#   records  zip, lat*1e5, lng*1e5, population, density*10, and four string ids
+INDEX_MAGIC = b'MLLOC001'
+HEADER_STRUCT = struct.Struct('<8sII')
+STRING_LEN_STRUCT = struct.Struct('<H')
+RECORD_STRUCT = struct.Struct('<IiiIIIIII')
+
+COORD_SCALE = 100000
+DENSITY_SCALE = 10
+
+# Used when no ZIP code data is available at all
+DEFAULT_LOCATIONS = [
+    {'city': 'New York', 'state': 'NY', 'lat': 40.7128, 'lng': -74.0060},
+    {'city': 'Los Angeles', 'state': 'CA', 'lat': 34.0522, 'lng': -118.2437},
+    {'city': 'Chicago', 'state': 'IL', 'lat': 41.8781, 'lng': -87.6298},
+]
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+def build_location_index(csv_path: Path = ZIP_CSV_PATH, index_path: Path = LOCATION_INDEX_PATH) -> int:
+    """Compile uszips.csv into the binary location index, returning the record count"""
+    strings = []
+    string_ids = {}
+
+    def string_id(value: str) -> int:
+        if value not in string_ids:
+            string_ids[value] = len(strings)
+            strings.append(value)
+        return string_ids[value]
+
+    records = []
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            records.append(RECORD_STRUCT.pack(
+                int(row['zip']),
+                round(float(row['lat']) * COORD_SCALE),
+                round(float(row['lng']) * COORD_SCALE),
+                int(row['population'] or 0),
+                round(float(row['density'] or 0) * DENSITY_SCALE),
+                string_id(row['city']),
+                string_id(row['state_id']),
+                string_id(row['state_name']),
+                string_id(row['county_name']),
+            ))
+
+    index_path = Path(index_path)
+    tmp_path = index_path.with_suffix('.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER_STRUCT.pack(INDEX_MAGIC, len(records), len(strings)))
+        for value in strings:
+            encoded = value.encode('utf-8')
+            f.write(STRING_LEN_STRUCT.pack(len(encoded)))
+            f.write(encoded)
+        f.write(b''.join(records))
+    tmp_path.replace(index_path)
+
+    with _cache_lock:
+        _cache.pop(str(index_path), None)
+
+    return len(records)
+
+def load_location_index(index_path: Path = LOCATION_INDEX_PATH) -> List[Dict]:
+    """Load the binary location index, sorted by population (largest first)
+
+    The decoded list is cached per process, so repeated Database() instances
+    share it. Returns an empty list if the index does not exist.
+    """
+    key = str(index_path)
+    with _cache_lock:
+        if key in _cache:
+            return _cache[key]
+
+        index_path = Path(index_path)
+        if not index_path.exists():
+            return []
+
+        data = index_path.read_bytes()
+        magic, record_count, string_count = HEADER_STRUCT.unpack_from(data, 0)
+        if magic != INDEX_MAGIC:
+            raise ValueError(f"Not a MapLeads location index: {index_path}")
+
+        offset = HEADER_STRUCT.size
+        strings = []
+        for _ in range(string_count):
+            (length,) = STRING_LEN_STRUCT.unpack_from(data, offset)
+            offset += STRING_LEN_STRUCT.size
+            strings.append(data[offset:offset + length].decode('utf-8'))
+            offset += length
+
+        end = offset + record_count * RECORD_STRUCT.size
+        locations = [
+            {
+                'zip': str(zip_code),
+                'lat': lat / COORD_SCALE,
+                'lng': lng / COORD_SCALE,
+                'city': strings[city],
+                'state': strings[state],
+                'state_name': strings[state_name],
+                'population': population,
+                'density': density / DENSITY_SCALE,
+                'county': strings[county],
+            }
+            for zip_code, lat, lng, population, density, city, state, state_name, county
+            in RECORD_STRUCT.iter_unpack(data[offset:end])
+        ]
+        locations.sort(key=lambda loc: loc['population'], reverse=True)
+
+        _cache[key] = locations
+        return locations
+
+def ensure_location_index(csv_path: Path = ZIP_CSV_PATH, index_path: Path = LOCATION_INDEX_PATH) -> bool:
+    """Build the location index from the CSV if it is missing; True if it exists afterwards"""
+    if Path(index_path).exists():
+        return True
+    if not Path(csv_path).exists():
+        return False
+    build_location_index(csv_path, index_path)
+    return True
+
+def filter_locations(states: Optional[List[str]] = None,
+                     cities: Optional[List[str]] = None,
+                     min_population: int = 0,
+                     index_path: Path = LOCATION_INDEX_PATH) -> List[Dict]:
+    """Get locations matching the filters, largest population first"""
+    if not ensure_location_index(index_path=index_path):
+        return [dict(loc) for loc in DEFAULT_LOCATIONS]
+
+    state_set = set(states) if states else None
+    city_set = set(cities) if cities else None
+
+    return [
+        dict(loc) for loc in load_location_index(index_path)
+        if loc['population'] >= min_population
+        and (state_set is None or loc['state'] in state_set)
+        and (city_set is None or loc['city'] in city_set)
+    ]
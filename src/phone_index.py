@@ -0,0 +1,70 @@
+"""
+In-memory phone number index for MapLeads
+Answers "have we seen this business?" without a database round-trip
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Optional
+
+def phone_number(phone: str) -> Optional[int]:
+    """The phone as an integer, when the integer maps back to exactly the same text
+    
+    Returns None for anything else (formatting, non-ASCII digits, a leading
+    zero, more digits than fit the index), which must be matched as text.
+    """
+    if phone and phone.isascii() and phone.isdigit() and phone[0] != '0' and len(phone) <= 19:
+        return int(phone)
+    return None
+
+class PhoneIndex:
+    """Exact membership set of known phone numbers.
+    
+    Phones are matched on the exact text stored in the database, as the
+    upsert's ON CONFLICT(phone) does. Plain digit phones loaded at startup
+    live in a sorted array of 64-bit integers (8 bytes each, ~4MB for 500k
+    businesses) searched with bisect; phones added during a scan go into a
+    small set on top of it. The rare phone stored with other characters is
+    kept as text.
+    """
+    
+    def __init__(self, phones: Iterable = ()):
+        """Build the index from an iterable of phone numbers"""
+        numbers = set()
+        self._text = set()
+        for phone in phones:
+            phone = str(phone)
+            number = phone_number(phone)
+            if number is None:
+                self._text.add(phone)
+            else:
+                numbers.add(number)
+        self._base = array('Q', sorted(numbers))
+        self._added = set()
+    
+    def __contains__(self, phone) -> bool:
+        phone = str(phone)
+        number = phone_number(phone)
+        if number is None:
+            return phone in self._text
+        if number in self._added:
+            return True
+        idx = bisect_left(self._base, number)
+        return idx < len(self._base) and self._base[idx] == number
+    
+    def __len__(self) -> int:
+        return len(self._base) + len(self._added) + len(self._text)
+    
+    def add(self, phone):
+        """Record a newly inserted phone number"""
+        phone = str(phone)
+        number = phone_number(phone)
+        if number is None:
+            self._text.add(phone)
+        elif phone not in self:
+            self._added.add(number)
+    
+    def update(self, phones: Iterable):
+        """Record several newly inserted phone numbers"""
+        for phone in phones:
+            self.add(phone)
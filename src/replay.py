@@ -0,0 +1,284 @@
+"""
+Offline record/replay for MapLeads
+Captures rendered Google Maps result pages to a local corpus and plays them
+back, so the scrape -> parse -> save pipeline can run without live traffic
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from selenium.common.exceptions import NoSuchElementException
+
+# Scripts are stripped from recorded pages so a replayed page is a static
+# snapshot of the rendered DOM and never calls out to Google
+SCRIPT_TAG_PATTERN = re.compile(r'<script\b[^>]*>.*?</script\s*>', re.IGNORECASE | re.DOTALL)
+
+def page_key(url: str) -> str:
+    """Short stable file name for a recorded URL"""
+    return hashlib.sha1(url.encode('utf-8')).hexdigest()[:16]
+
+class PageCorpus:
+    """Directory of recorded result pages.
+    
+    Layout: index.json maps each URL to its key; <key>.html holds the static
+    DOM snapshot and <key>.json the card payload extracted when recording.
+    Pages recorded since the last close() are appended to index.jsonl, one
+    line each, and folded into index.json by close().
+    """
+    
+    def __init__(self, directory):
+        """Open (or create) a corpus directory"""
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.directory / 'index.json'
+        self.journal_path = self.directory / 'index.jsonl'
+        self._lock = threading.Lock()
+        self._journal = None  # Append handle, opened by the first save()
+        self._journal_cut = False  # Whether the journal ends in a partial line
+        
+        if self.index_path.exists():
+            with open(self.index_path, 'r') as f:
+                self.index = json.load(f)
+        else:
+            self.index = {}
+        
+        # Pages recorded by a run that never reached close()
+        if self.journal_path.exists():
+            with open(self.journal_path, 'r') as f:
+                for line in f:
+                    self._journal_cut = not line.endswith('\n')
+                    try:
+                        url, entry = json.loads(line)
+                    except ValueError:
+                        continue  # Line cut off by a crash
+                    self.index[url] = entry
+    
+    def __len__(self) -> int:
+        return len(self.index)
+    
+    def __contains__(self, url: str) -> bool:
+        return url in self.index
+    
+    def urls(self) -> List[str]:
+        """Recorded URLs in recording order"""
+        return list(self.index)
+    
+    def save(self, url: str, html: str, cards: List[Dict]):
+        """Record one rendered page and its extracted cards"""
+        key = page_key(url)
+        (self.directory / f'{key}.html').write_text(SCRIPT_TAG_PATTERN.sub('', html), encoding='utf-8')
+        (self.directory / f'{key}.json').write_text(json.dumps(cards), encoding='utf-8')
+        
+        entry = {'key': key, 'cards': len(cards), 'recorded_at': time.time()}
+        with self._lock:
+            self.index[url] = entry
+            if self._journal is None:
+                self._journal = open(self.journal_path, 'a', encoding='utf-8')
+                if self._journal_cut:
+                    self._journal.write('\n')
+                    self._journal_cut = False
+            self._journal.write(json.dumps([url, entry]) + '\n')
+            self._journal.flush()
+    
+    def close(self):
+        """Fold pages recorded since the last close into index.json"""
+        with self._lock:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            if not self.journal_path.exists():
+                return
+            
+            # Replace the index in one step so a crash leaves the old one intact
+            temp_path = self.index_path.with_suffix('.json.tmp')
+            with open(temp_path, 'w') as f:
+                json.dump(self.index, f, indent=2)
+            temp_path.replace(self.index_path)
+            self.journal_path.unlink()
+    
+    def load_html(self, url: str) -> Optional[str]:
+        """Recorded HTML snapshot for a URL, or None"""
+        entry = self.index.get(url)
+        if not entry:
+            return None
+        return (self.directory / f"{entry['key']}.html").read_text(encoding='utf-8')
+    
+    def load_html_by_key(self, key: str) -> Optional[str]:
+        """Recorded HTML snapshot by file key, or None"""
+        path = self.directory / f'{key}.html'
+        if not path.exists():
+            return None
+        return path.read_text(encoding='utf-8')
+    
+    def load_cards(self, url: str) -> List[Dict]:
+        """Recorded card payload for a URL (empty if the URL was never recorded)"""
+        entry = self.index.get(url)
+        if not entry:
+            return []
+        return json.loads((self.directory / f"{entry['key']}.json").read_text(encoding='utf-8'))
+
+class ReplayServer:
+    """Local HTTP server that serves recorded pages to a real browser"""
+    
+    def __init__(self, corpus: PageCorpus, host: str = '127.0.0.1', port: int = 0):
+        """Bind the server (port 0 picks a free port); call start() to serve"""
+        self.corpus = corpus
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(handler):
+                key = handler.path.strip('/').split('/')[-1]
+                html = corpus.load_html_by_key(key)
+                if html is None:
+                    handler.send_error(404, 'Page not recorded')
+                    return
+                body = html.encode('utf-8')
+                handler.send_response(200)
+                handler.send_header('Content-Type', 'text/html; charset=utf-8')
+                handler.send_header('Content-Length', str(len(body)))
+                handler.end_headers()
+                handler.wfile.write(body)
+            
+            def log_message(handler, format, *args):
+                pass
+        
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.host, self.port = self.httpd.server_address[:2]
+        self._thread = None
+    
+    def start(self):
+        """Serve in a background thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+            self._thread.start()
+    
+    def stop(self):
+        """Shut the server down"""
+        if self._thread is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self._thread = None
+    
+    def url_for(self, url: str) -> str:
+        """Local address of a recorded Google Maps URL"""
+        return f'http://{self.host}:{self.port}/page/{page_key(url)}'
+
+class BrowserReplayDriver:
+    """Wraps a real WebDriver so every get() loads the recorded page from a ReplayServer.
+    
+    Waiting and extraction run in a real browser against the recorded DOM,
+    which is what changes to the wait/extraction JavaScript need.
+    """
+    
+    def __init__(self, driver, server: ReplayServer):
+        self._driver = driver
+        self._server = server
+    
+    def get(self, url: str):
+        self._driver.get(self._server.url_for(url))
+    
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+class _ReplayElement:
+    """Minimal stand-in for a WebElement built from a recorded card payload"""
+    
+    def __init__(self, card: Optional[Dict] = None):
+        self._card = card or {}
+        self.text = self._card.get('text', '')
+    
+    def find_element(self, by, value):
+        if self._card.get('website'):
+            return _ReplayLink(self._card['website'])
+        raise NoSuchElementException(value)
+
+class _ReplayLink:
+    """Element whose parent carries a recorded href"""
+    
+    def __init__(self, href: str):
+        self._href = href
+    
+    def find_element(self, by, value):
+        return self
+    
+    def get_attribute(self, name):
+        return self._href if name == 'href' else None
+
+class ReplayDriver:
+    """Browser-free driver that answers the scraper's calls from a PageCorpus.
+    
+    The scraper's extraction script returns the recorded card payload, the
+    results wait finishes immediately, and unrecorded URLs look like empty
+    result pages. Runs the whole pipeline at Python speed with deterministic
+    output.
+    """
+    
+    def __init__(self, corpus: PageCorpus):
+        self.corpus = corpus
+        self.current_url = None
+    
+    def get(self, url: str):
+        self.current_url = url
+    
+    @property
+    def page_source(self) -> str:
+        return self.corpus.load_html(self.current_url) or ''
+    
+    def find_element(self, by, value):
+        return _ReplayElement()
+    
+    def find_elements(self, by, value):
+        return [_ReplayElement(card) for card in self.corpus.load_cards(self.current_url)]
+    
+    def execute_script(self, script, *args):
+        from .scraper_continuous import JS_EXTRACT_CARDS
+        
+        # The card extraction script is the only one whose result the scraper uses
+        if script == JS_EXTRACT_CARDS:
+            return self.corpus.load_cards(self.current_url)
+        return None
+    
+    def execute_async_script(self, script, *args):
+        return 'end'
+    
+    def set_script_timeout(self, seconds):
+        pass
+    
+    def quit(self):
+        pass
+
+def run_replay(scraper, corpus: PageCorpus) -> Dict:
+    """Run every recorded page through scrape -> parse -> upsert and time it"""
+    driver = scraper.setup_driver(0)
+    scraper.instance_stats[0] = scraper._new_instance_stats()
+    if scraper.phone_index is None:
+        scraper._load_phone_index()
+    
+    pages = 0
+    cards = 0
+    new_businesses = 0
+    start = time.perf_counter()
+    
+    try:
+        for url in corpus.urls():
+            businesses = scraper._scrape_url_with_driver(url, driver, 0)
+            new_businesses += len(scraper.db.upsert_businesses(businesses, scraper.phone_index))
+            pages += 1
+            cards += scraper.instance_stats[0]['last_card_count']
+    finally:
+        driver.quit()
+    
+    seconds = time.perf_counter() - start
+    return {
+        'pages': pages,
+        'cards': cards,
+        'businesses': scraper.stats['businesses_found'],
+        'new_businesses': new_businesses,
+        'seconds': seconds,
+        'pages_per_minute': pages / seconds * 60 if seconds else 0.0,
+    }
@@ -0,0 +1,170 @@
+"""
+Revisit scheduling for MapLeads
+Decides which locations are due for another scan based on how many new
+businesses each one has produced
+"""
+
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+# Weight of the latest scan in the running averages
+YIELD_SMOOTHING = 0.3
+
+# Cap on how many times an unproductive location's interval is doubled
+MAX_BACKOFF_DOUBLINGS = 10
+
+def location_key(location: Dict) -> str:
+    """Stable identifier for a search location"""
+    return f"{location['lat']:.5f},{location['lng']:.5f}"
+
+def new_history_entry() -> Dict:
+    """History of a location that has not been scanned yet"""
+    return {
+        'scans': 0,
+        'avg_new': 0.0,
+        'churn': 0.0,
+        'empty_streak': 0,
+        'total_new': 0,
+        'last_scanned': None
+    }
+
+class RevisitScheduler:
+    """Priority scheduler over a fixed set of search locations.
+    
+    Every location gets a revisit interval derived from its history:
+    the base interval is shortened for locations that keep producing new
+    businesses (and whose result lists keep changing) and doubled for every
+    consecutive scan that found nothing.
+    The interval is always clamped between min_revisit_hours and the
+    location's freshness SLA, so no area goes unchecked for longer than the
+    SLA. Locations never scanned before are always due first.
+    """
+    
+    def __init__(self, database, category: str,
+                 base_interval_hours: float = 24,
+                 min_revisit_hours: float = 1,
+                 freshness_sla_hours: float = 168,
+                 freshness_overrides: Optional[Dict[str, float]] = None):
+        """Load scan history for `category` from the database"""
+        self.db = database
+        self.category = category
+        self.base_interval = timedelta(hours=base_interval_hours)
+        self.min_interval = timedelta(hours=min_revisit_hours)
+        self.freshness_sla = timedelta(hours=freshness_sla_hours)
+        self.freshness_overrides = freshness_overrides or {}
+        self.history = self.db.get_location_history(category)
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_config(cls, database, monitoring_config: Dict) -> 'RevisitScheduler':
+        """Create a scheduler from the monitoring section of the config"""
+        return cls(
+            database,
+            monitoring_config['category'],
+            base_interval_hours=monitoring_config.get('revisit_base_hours', 24),
+            min_revisit_hours=monitoring_config.get('min_revisit_hours', 1),
+            freshness_sla_hours=monitoring_config.get('freshness_sla_hours', 168),
+            freshness_overrides=monitoring_config.get('freshness_overrides')
+        )
+    
+    def _sla_for(self, location: Dict) -> timedelta:
+        """Freshness SLA for a location: ZIP, then 'City, ST', then state override"""
+        for key in (location.get('zip'),
+                    f"{location.get('city')}, {location.get('state')}",
+                    location.get('state')):
+            if key in self.freshness_overrides:
+                return timedelta(hours=self.freshness_overrides[key])
+        return self.freshness_sla
+    
+    def revisit_interval(self, location: Dict) -> timedelta:
+        """How long to wait between scans of a location"""
+        sla = self._sla_for(location)
+        entry = self.history.get(location_key(location))
+        if not entry:
+            return min(self.min_interval, sla)
+        
+        backoff = 2 ** min(entry['empty_streak'], MAX_BACKOFF_DOUBLINGS)
+        interval = self.base_interval * backoff / ((1 + entry['avg_new']) * (1 + entry['churn']))
+        return max(min(interval, sla), min(self.min_interval, sla))
+    
+    def due_locations(self, locations: List[Dict], now: Optional[datetime] = None) -> List[Dict]:
+        """Locations whose interval has elapsed, most overdue first"""
+        now = now or datetime.now()
+        scored = []
+        
+        with self._lock:
+            for location in locations:
+                entry = self.history.get(location_key(location))
+                if not entry or not entry['last_scanned']:
+                    scored.append((float('inf'), location))
+                    continue
+                
+                elapsed = now - entry['last_scanned']
+                ratio = elapsed / self.revisit_interval(location)
+                if ratio >= 1:
+                    scored.append((ratio, location))
+        
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [location for _, location in scored]
+    
+    def next_due_in(self, locations: List[Dict], now: Optional[datetime] = None) -> timedelta:
+        """Time until the next location becomes due (zero if one already is)"""
+        now = now or datetime.now()
+        soonest = None
+        
+        with self._lock:
+            for location in locations:
+                entry = self.history.get(location_key(location))
+                if not entry or not entry['last_scanned']:
+                    return timedelta(0)
+                wait = entry['last_scanned'] + self.revisit_interval(location) - now
+                if soonest is None or wait < soonest:
+                    soonest = wait
+        
+        return max(soonest or timedelta(0), timedelta(0))
+    
+    def record_scan(self, location: Dict, results: int, new_businesses: int):
+        """Update a location's history after it has been scanned"""
+        key = location_key(location)
+        
+        with self._lock:
+            entry = self.history.get(key) or new_history_entry()
+            
+            churn = new_businesses / results if results else 0.0
+            if entry['scans']:
+                entry['avg_new'] += YIELD_SMOOTHING * (new_businesses - entry['avg_new'])
+                entry['churn'] += YIELD_SMOOTHING * (churn - entry['churn'])
+            else:
+                # The first scan of a location finds everything; it says nothing about yield
+                entry['avg_new'] = 0.0
+                entry['churn'] = 0.0
+            
+            if entry['scans'] and new_businesses == 0:
+                entry['empty_streak'] += 1
+            else:
+                entry['empty_streak'] = 0
+            
+            entry['scans'] += 1
+            entry['total_new'] += new_businesses
+            entry['last_scanned'] = datetime.now()
+            self.history[key] = dict(entry)
+        
+        self.db.save_location_history(self.category, key, entry)
+    
+    def record_failure(self, location: Dict):
+        """Update a location's history after a scan of it failed
+        
+        A failed attempt counts like an empty scan: the location is not due
+        again until its backed-off interval has passed, so one that keeps
+        failing is not retried straight away.
+        """
+        key = location_key(location)
+        
+        with self._lock:
+            entry = self.history.get(key) or new_history_entry()
+            entry['empty_streak'] += 1
+            entry['last_scanned'] = datetime.now()
+            self.history[key] = dict(entry)
+        
+        self.db.save_location_history(self.category, key, entry)
@@ -16,6 +16,7 @@ from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 from tqdm import tqdm
 
+from .coverage import plan_search_points
 from .database import Database
 
 # Phone number cleaning
@@ -157,6 +158,8 @@ class MapLeadsScraper:
             cities=locations_config.get('cities'),
             min_population=locations_config.get('min_population', 0)
         )
+        if monitoring_config.get('search_grid', True):
+            locations = plan_search_points(locations)
         
         urls = []
         for category in categories:
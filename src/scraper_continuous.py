@@ -4,6 +4,7 @@ Handles Google Maps scraping with Selenium
 """
 
 import re
+import queue
 import time
 import random
 import threading
@@ -14,32 +15,107 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
-from tqdm import tqdm
 
+from .coverage import MAX_SPLIT_ZOOM, RESULT_LIST_CAP, SEARCH_ZOOM, plan_search_points, split_viewport
 from .database import Database
+from .db_writer import DatabaseWriter
+from .phone_index import PhoneIndex
+from .scheduler import RevisitScheduler, location_key
 
 # Phone number cleaning
 PHONE_TRANSLATION_TABLE = str.maketrans({"(": None, ")": None, " ": None, "-": None})
 
-# JavaScript for auto-scrolling
-JS_SCROLL_SCRIPT = """
-function scroll() {
-    const elements = document.querySelectorAll("*");
-    for (let i = 0; i < elements.length; i++) {
-        if (elements[i].scrollHeight > elements[i].offsetHeight) {
-            elements[i].scrollTop = elements[i].scrollHeight;
-        }
-    }
-    
-    const targetPhrase = "You've reached the end of the list.";
-    if (document.documentElement.innerHTML.includes(targetPhrase)) {
-        clearInterval(intervalId);
+# A browser instance stops taking work after this many failed locations in a row
+MAX_CONSECUTIVE_FAILURES = 5
+
+# A failed location is retried on resume until it has been attempted this many
+# times in a cycle; after that the cycle can close and the scheduler takes over
+MAX_CYCLE_ATTEMPTS = 6
+
+# Seconds to wait before the next pass when a pass finished no location
+CYCLE_RETRY_PAUSE = 60
+
+# Selector for the scrollable results list on a Google Maps search page
+RESULTS_FEED_SELECTOR = 'div[role="feed"]'
+
+# JavaScript that scrolls the results feed and resolves once the list is complete.
+# A MutationObserver re-scrolls whenever new cards arrive; the promise resolves
+# when the end-of-list marker appears, when no new cards arrive for idleMs, or
+# after timeoutMs. Runs via execute_async_script, so Python just waits for it.
+JS_WAIT_FOR_RESULTS = """
+const [selector, timeoutMs, idleMs, done] = arguments;
+const feed = document.querySelector(selector);
+if (!feed) {
+    done('no-feed');
+    return;
+}
+
+let finished = false;
+let checkQueued = false;
+let idleTimer = null;
+let hardTimer = null;
+let observer = null;
+
+function finish(reason) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(idleTimer);
+    clearTimeout(hardTimer);
+    done(reason);
+}
+
+function check() {
+    checkQueued = false;
+    if (feed.textContent.includes("reached the end of the list")) {
+        finish('end');
+        return;
     }
+    feed.scrollTop = feed.scrollHeight;
+    clearTimeout(idleTimer);
+    idleTimer = setTimeout(() => finish('idle'), idleMs);
 }
 
-const intervalId = setInterval(scroll, 500);
+// Cards arrive in bursts; check at most once per burst
+observer = new MutationObserver(() => {
+    if (!checkQueued) {
+        checkQueued = true;
+        setTimeout(check, 100);
+    }
+});
+observer.observe(feed, {childList: true, subtree: true});
+hardTimer = setTimeout(() => finish('timeout'), timeoutMs);
+check();
+"""
+
+# XPath matching one business card in the results list
+CARD_XPATH = '//div[contains(@jsaction, "mouseover")]'
+
+# JavaScript that reads every card's fields in a single WebDriver call,
+# instead of several round-trips per card through card.text/find_element
+JS_EXTRACT_CARDS = """
+const snapshot = document.evaluate(
+    arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+);
+const cards = [];
+for (let i = 0; i < snapshot.snapshotLength; i++) {
+    const card = snapshot.snapshotItem(i);
+    const websiteLabel = document.evaluate(
+        ".//div[contains(text(), 'Website')]", card, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+    const websiteLink = websiteLabel ? websiteLabel.parentElement : null;
+    const placeLink = card.querySelector('a[href*="/maps/place/"]');
+    cards.push({
+        text: card.innerText,
+        website: websiteLink ? (websiteLink.href || websiteLink.getAttribute('href')) : null,
+        place_url: placeLink ? placeLink.href : null
+    });
+}
+return cards;
 """
 
 class MapLeadsScraper:
@@ -49,7 +125,19 @@ class MapLeadsScraper:
         self.headless = headless
         self.driver = None
         self.drivers = []  # For multiple browser instances
-        self.db_lock = threading.Lock()  # For thread-safe database access
+        self.writer = None  # Background database writer for parallel scans
+        self.phone_index = None  # Known phones, loaded when a scan starts
+        self.max_split_zoom = MAX_SPLIT_ZOOM  # Deepest zoom for splitting saturated searches
+        self.scheduler = None  # Decides which locations are due for a revisit
+        self.location_retries = 2  # Times a failed location is requeued in a cycle
+        self.feed_timeout = 10  # Seconds to wait for the results list to appear
+        self.results_timeout = 20  # Seconds to keep scrolling a results list
+        self.results_idle_timeout = 4  # Seconds without new results before giving up
+        self.card_extraction = 'javascript'  # 'javascript' (one call per page) or 'webdriver'
+        self.request_delay = (1, 3)  # Seconds to pause between baseline requests
+        self.recorder = None  # PageCorpus that rendered result pages are recorded to
+        self.replay_corpus = None  # PageCorpus that replaces live Google Maps
+        self.replay_server = None  # Serves replay_corpus to real browsers
         self.stats = {
             'urls_processed': 0,
             'businesses_found': 0,
@@ -58,11 +146,35 @@ class MapLeadsScraper:
             'total_cycles': 0
         }
         self.stats_lock = threading.Lock()  # For thread-safe stats updates
-        self.current_position = {'location_idx': 0}
+        self.cycle_id = None  # Checkpoint of the scan cycle in progress
+        self.stop_requested = threading.Event()  # Set by request_stop() to end a scan early
         self.instance_stats = {}  # Progress tracking per instance
     
+    def enable_recording(self, directory: str):
+        """Record every rendered result page to a corpus directory"""
+        from .replay import PageCorpus
+        self.recorder = PageCorpus(directory)
+    
+    def enable_replay(self, directory: str, browser: bool = False):
+        """Scrape recorded pages instead of Google Maps
+        
+        By default no browser is started at all; with browser=True Chrome
+        loads the recorded pages from a local server, so the wait and
+        extraction scripts run for real.
+        """
+        from .replay import PageCorpus, ReplayServer
+        self.replay_corpus = PageCorpus(directory)
+        self.request_delay = (0, 0)
+        if browser:
+            self.replay_server = ReplayServer(self.replay_corpus)
+            self.replay_server.start()
+    
     def setup_driver(self, instance_id: int = 0) -> webdriver.Chrome:
         """Initialize Chrome driver for a specific instance"""
+        if self.replay_corpus is not None and self.replay_server is None:
+            from .replay import ReplayDriver
+            return ReplayDriver(self.replay_corpus)
+        
         try:
             options = ChromeOptions()
             
@@ -92,6 +204,10 @@ class MapLeadsScraper:
             # Remove webdriver property
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
+            if self.replay_server is not None:
+                from .replay import BrowserReplayDriver
+                driver = BrowserReplayDriver(driver, self.replay_server)
+            
             return driver
             
         except Exception as e:
@@ -105,12 +221,7 @@ class MapLeadsScraper:
             driver = self.setup_driver(i)
             if driver:
                 self.drivers.append(driver)
-                self.instance_stats[i] = {
-                    'urls_processed': 0,
-                    'businesses_found': 0,
-                    'new_businesses': 0,
-                    'current_location': 'Ready'
-                }
+                self.instance_stats[i] = self._new_instance_stats()
             else:
                 # Clean up already created drivers on failure
                 for d in self.drivers:
@@ -120,6 +231,16 @@ class MapLeadsScraper:
         print(f"✅ Initialized {len(self.drivers)} browser instances")
         return True
     
+    def _new_instance_stats(self) -> Dict:
+        """Fresh progress counters for one browser instance"""
+        return {
+            'urls_processed': 0,
+            'businesses_found': 0,
+            'new_businesses': 0,
+            'last_card_count': 0,
+            'current_location': 'Ready'
+        }
+    
     def continuous_scan(self, monitoring_config: Dict) -> None:
         """Run continuous scanning through all locations with parallel processing"""
         num_instances = monitoring_config.get('browser_instances', 1)
@@ -133,55 +254,79 @@ class MapLeadsScraper:
             batch_size = monitoring_config.get('batch_size', 10)
             
             # Get all locations once
-            all_locations = self.db.get_locations_for_filters(
-                states=locations_config.get('states'),
-                cities=locations_config.get('cities'),
-                min_population=locations_config.get('min_population', 0)
-            )
+            all_locations = self._get_search_locations(monitoring_config)
             
             if not all_locations:
                 print("No locations found matching criteria")
                 return
             
+            self._load_phone_index()
+            self.writer = DatabaseWriter(self.db, phone_index=self.phone_index)
+            self.writer.start()
+            self.scheduler = RevisitScheduler.from_config(self.db, monitoring_config)
+            
             print(f"Found {len(all_locations)} locations to monitor")
             print(f"Monitoring category: {category}")
             print(f"Browser instances: {num_instances}")
             print(f"Total locations to check: {len(all_locations)}")
             
-            while True:  # Continuous loop
+            while not self.stop_requested.is_set():  # Continuous loop
+                # Finish an interrupted cycle first, otherwise scan locations
+                # whose revisit interval has elapsed
+                due_locations = self._resume_cycle('continuous', monitoring_config, all_locations)
+                if not due_locations:
+                    due_locations = self.scheduler.due_locations(all_locations)
+                    if not due_locations:
+                        wait = self.scheduler.next_due_in(all_locations)
+                        print(f"💤 No locations due for a revisit, next one in {wait.total_seconds() / 60:.0f} minutes")
+                        self.stop_requested.wait(min(max(wait.total_seconds(), 60), 900))
+                        continue
+                    self._start_cycle('continuous', monitoring_config, due_locations)
+                
                 cycle_start = datetime.now()
+                cycle_id = self.cycle_id
+                done_before = self.db.get_scan_cycle_progress(cycle_id).get('done', 0)
                 
                 print(f"\n📍 Processing category: {category}")
+                print(f"   {len(due_locations)} of {len(all_locations)} locations due for a revisit")
                 category_formatted = category.replace(' ', '+')
                 
                 # Create progress display thread
                 progress_thread = threading.Thread(target=self._display_progress, daemon=True)
                 progress_thread.start()
                 
-                # Process all locations in parallel batches
-                self._process_locations_parallel(all_locations, category_formatted, num_instances)
+                # Process due locations in parallel batches
+                self._process_locations_parallel(due_locations, category_formatted, num_instances)
                 
-                # Completed full cycle
-                self.stats['total_cycles'] += 1
+                # Make sure every scraped page is saved before reporting the cycle
+                self.writer.flush()
+                finished = self.db.get_scan_cycle_progress(cycle_id).get('done', 0) - done_before
+                cycle_closed = self._complete_cycle()
                 cycle_duration = (datetime.now() - cycle_start).total_seconds() / 60
                 
-                print(f"\n✅ Completed full cycle #{self.stats['total_cycles']}")
+                if cycle_closed:
+                    # Completed full cycle
+                    self.stats['total_cycles'] += 1
+                    print(f"\n✅ Completed full cycle #{self.stats['total_cycles']}")
+                else:
+                    print(f"\n⚠️  Cycle incomplete, its unfinished locations are retried first")
                 print(f"   Duration: {cycle_duration:.1f} minutes")
                 print(f"   Total new businesses found: {self.stats['new_businesses']}")
+                
+                # Every location failed, e.g. the browsers are down; don't spin on them
+                if not finished:
+                    print(f"⚠️  No location was scanned successfully, pausing {CYCLE_RETRY_PAUSE} seconds")
+                    self.stop_requested.wait(CYCLE_RETRY_PAUSE)
                 print(f"   Starting next cycle...\n")
                 
                 # Record cycle completion
-                with self.db_lock:
-                    self.db.add_scan_record(
-                        categories=[category],
-                        locations=locations_config,
-                        businesses_found=self.stats['businesses_found'],
-                        new_businesses=self.stats['new_businesses'],
-                        duration_seconds=int(cycle_duration * 60)
-                    )
-                
-                # Pause between cycles
-                time.sleep(60)
+                self.db.add_scan_record(
+                    categories=[category],
+                    locations=locations_config,
+                    businesses_found=self.stats['businesses_found'],
+                    new_businesses=self.stats['new_businesses'],
+                    duration_seconds=int(cycle_duration * 60)
+                )
                 
         except KeyboardInterrupt:
             print("\n⏹️  Stopping continuous scan...")
@@ -189,23 +334,136 @@ class MapLeadsScraper:
         finally:
             self.cleanup()
 
+    def _resume_cycle(self, mode: str, monitoring_config: Dict, locations: List[Dict]) -> List[Dict]:
+        """Pick up an unfinished cycle with the same settings; returns its remaining locations"""
+        cycle_id = self.db.get_open_scan_cycle(
+            mode, monitoring_config['category'], monitoring_config['locations']
+        )
+        if cycle_id is None:
+            return []
+        
+        remaining = set(self.db.get_scan_cycle_remaining(cycle_id, MAX_CYCLE_ATTEMPTS))
+        resumed = [location for location in locations if location_key(location) in remaining]
+        if not resumed:
+            self.db.complete_scan_cycle(cycle_id)
+            return []
+        
+        print(f"♻️  Resuming interrupted {mode} scan: {len(resumed)} locations left")
+        self.cycle_id = cycle_id
+        return resumed
+    
+    def _start_cycle(self, mode: str, monitoring_config: Dict, locations: List[Dict]):
+        """Checkpoint a new cycle with every location pending"""
+        self.cycle_id = self.db.start_scan_cycle(
+            mode,
+            monitoring_config['category'],
+            monitoring_config['locations'],
+            [location_key(location) for location in locations]
+        )
+    
+    def _complete_cycle(self) -> bool:
+        """Close the current cycle's checkpoint unless some locations still need another attempt
+        
+        Returns whether the cycle was closed. An open cycle is picked up
+        again by _resume_cycle.
+        """
+        if self.cycle_id is None:
+            return True
+        
+        cycle_id, self.cycle_id = self.cycle_id, None
+        remaining = self.db.get_scan_cycle_remaining(cycle_id, MAX_CYCLE_ATTEMPTS)
+        if remaining:
+            print(f"⚠️  {len(remaining)} locations are not done; the cycle stays open and they will be retried")
+            return False
+        
+        self.db.complete_scan_cycle(cycle_id)
+        return True
+    
+    def _checkpoint(self, location: Dict, status: str, error: Optional[str] = None):
+        """Record a location's progress in the current cycle"""
+        if self.cycle_id is None:
+            return
+        try:
+            self.db.set_scan_cycle_location_status(self.cycle_id, location_key(location), status, error)
+        except Exception as e:
+            print(f"  ⚠️  Could not save checkpoint for {location['city']}: {e}")
+    
+    def _apply_scan_settings(self, monitoring_config: Dict):
+        """Copy tuning options from the monitoring config onto the scraper"""
+        self.max_split_zoom = monitoring_config.get('max_split_zoom', MAX_SPLIT_ZOOM)
+        self.location_retries = monitoring_config.get('location_retries', 2)
+        self.feed_timeout = monitoring_config.get('feed_timeout', 10)
+        self.results_timeout = monitoring_config.get('results_timeout', 20)
+        self.results_idle_timeout = monitoring_config.get('results_idle_timeout', 4)
+        self.card_extraction = monitoring_config.get('card_extraction', 'javascript')
+    
+    def _get_search_locations(self, monitoring_config: Dict) -> List[Dict]:
+        """Get the locations to search, merged into viewport tiles unless disabled"""
+        self._apply_scan_settings(monitoring_config)
+        
+        locations_config = monitoring_config['locations']
+        locations = self.db.get_locations_for_filters(
+            states=locations_config.get('states'),
+            cities=locations_config.get('cities'),
+            min_population=locations_config.get('min_population', 0)
+        )
+        
+        if locations and monitoring_config.get('search_grid', True):
+            zip_count = len(locations)
+            locations = plan_search_points(locations)
+            print(f"Planned {len(locations)} searches covering {zip_count} ZIP codes")
+        
+        return locations
+    
+    def _search_url(self, category_formatted: str, location: Dict) -> str:
+        """Build the Google Maps search URL for a location"""
+        return (
+            f"https://www.google.com/maps/search/{category_formatted}/@"
+            f"{location['lat']},{location['lng']},{location.get('zoom', SEARCH_ZOOM)}z"
+        )
+    
+    def _scrape_location_with_driver(self, category_formatted: str, location: Dict,
+                                     driver: webdriver.Chrome, instance_id: int) -> List[Dict]:
+        """Scrape a location, splitting saturated result lists into higher-zoom quadrants"""
+        businesses = []
+        pending = [location]
+        
+        while pending:
+            search = pending.pop()
+            url = self._search_url(category_formatted, search)
+            businesses.extend(self._scrape_url_with_driver(url, driver, instance_id))
+            
+            # A full result list means Google Maps likely dropped some places
+            card_count = self.instance_stats[instance_id].get('last_card_count', 0)
+            zoom = search.get('zoom', SEARCH_ZOOM)
+            if card_count >= RESULT_LIST_CAP and zoom < self.max_split_zoom:
+                print(f"  🔍 [Instance {instance_id}] {card_count} results near {search['city']}, {search['state']} - splitting into zoom {zoom + 1}")
+                pending.extend(split_viewport(search))
+        
+        return businesses
+    
+    def _load_phone_index(self):
+        """Preload known phone numbers so most existence checks skip SQLite"""
+        self.phone_index = PhoneIndex(self.db.iter_phones())
+        print(f"Loaded {len(self.phone_index)} known phone numbers")
+    
     def _process_locations_parallel(self, locations: List[Dict], category_formatted: str, num_instances: int):
-        """Process locations using multiple browser instances"""
-        # Split locations among instances
-        chunks = [locations[i::num_instances] for i in range(num_instances)]
-        
-        with ThreadPoolExecutor(max_workers=num_instances) as executor:
-            futures = []
-            
-            for instance_id, chunk in enumerate(chunks):
-                if chunk:  # Only create thread if there are locations to process
-                    future = executor.submit(
-                        self._process_location_chunk, 
-                        chunk, 
-                        category_formatted, 
-                        instance_id
-                    )
-                    futures.append(future)
+        """Process locations using multiple browser instances pulling from a shared queue"""
+        # Every instance takes the next location as soon as it is free, so a
+        # slow or failing browser never holds up a fixed share of the work
+        work = queue.Queue()
+        for location in locations:
+            work.put((location, 0))
+        
+        instance_count = min(num_instances, len(self.drivers), len(locations))
+        for instance_id in range(instance_count, len(self.drivers)):
+            self.instance_stats[instance_id]['current_location'] = 'Completed'
+        
+        with ThreadPoolExecutor(max_workers=max(instance_count, 1)) as executor:
+            futures = [
+                executor.submit(self._process_location_queue, work, category_formatted, instance_id)
+                for instance_id in range(instance_count)
+            ]
             
             # Wait for all threads to complete
             for future in as_completed(futures):
@@ -213,66 +471,119 @@ class MapLeadsScraper:
                     future.result()
                 except Exception as e:
                     print(f"Thread error: {e}")
+        
+        if not work.empty():
+            print(f"⚠️  {work.qsize()} locations were left unscanned; they stay pending in this cycle")
 
-    def _process_location_chunk(self, locations: List[Dict], category_formatted: str, instance_id: int):
-        """Process a chunk of locations with a specific browser instance"""
+    def _process_location_queue(self, work: queue.Queue, category_formatted: str, instance_id: int):
+        """Take locations from the shared queue with one browser instance until it is empty"""
         driver = self.drivers[instance_id]
+        consecutive_failures = 0
         
-        for location in locations:
+        while not self.stop_requested.is_set():
             try:
-                # Update instance status
-                self.instance_stats[instance_id]['current_location'] = f"{location['city']}, {location['state']}"
-                
-                url = (
-                    f"https://www.google.com/maps/search/{category_formatted}/@"
-                    f"{location['lat']},{location['lng']},13z"
-                )
-                
-                businesses = self._scrape_url_with_driver(url, driver, instance_id)
-                new_count = 0
-                
-                # Check if we got any businesses with phone numbers
-                businesses_with_phones = [b for b in businesses if b.get('phone')]
-                if not businesses_with_phones and businesses:
-                    print(f"  ⚠️  [Instance {instance_id}] Found {len(businesses)} businesses in {location['city']}, {location['state']} but no phone numbers")
-                    continue
-                
-                # Check each business (with database locking)
-                with self.db_lock:
-                    for business in businesses:
-                        if not business.get('phone'):
-                            continue
-                        
-                        # Add location info
-                        business['city'] = location.get('city', 'Unknown')
-                        business['state'] = location.get('state', 'Unknown')
-                        business['zip_code'] = location.get('zip', 'Unknown')
-                        
-                        if self.db.business_exists(business['phone']):
-                            self.db.update_last_seen(business['phone'])
-                            with self.stats_lock:
-                                self.stats['existing_businesses'] += 1
-                        else:
-                            # New business found!
-                            business_id = self.db.add_business(business)
-                            business['id'] = business_id
-                            with self.stats_lock:
-                                self.stats['new_businesses'] += 1
-                            new_count += 1
-                            
-                
-                if new_count > 0:
-                    print(f"  ✨ [Instance {instance_id}] Found {new_count} new businesses in {location['city']}, {location['state']}")
-                
-                # Update instance stats
-                self.instance_stats[instance_id]['new_businesses'] += new_count
-                
+                location, attempts = work.get_nowait()
+            except queue.Empty:
+                break
+            
+            try:
+                self._process_location(location, category_formatted, driver, instance_id)
+                consecutive_failures = 0
             except Exception as e:
-                print(f"  ❌ [Instance {instance_id}] Error processing {location['city']}: {e}")
+                consecutive_failures += 1
+                if attempts < self.location_retries:
+                    # Put it back for whichever instance is free next
+                    print(f"  🔁 [Instance {instance_id}] Error processing {location['city']}, retrying: {e}")
+                    work.put((location, attempts + 1))
+                else:
+                    print(f"  ❌ [Instance {instance_id}] Error processing {location['city']}: {e}")
+                    self._record_location_failure(location)
+                    self._checkpoint(location, 'failed', str(e))
+                
+                if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+                    print(f"  ❌ [Instance {instance_id}] {consecutive_failures} failures in a row, retiring this browser")
+                    break
         
         # Mark instance as completed
         self.instance_stats[instance_id]['current_location'] = 'Completed'
 
+    def _process_location(self, location: Dict, category_formatted: str,
+                          driver: webdriver.Chrome, instance_id: int):
+        """Scrape one location and queue its businesses for saving"""
+        # Update instance status
+        self.instance_stats[instance_id]['current_location'] = f"{location['city']}, {location['state']}"
+        self._checkpoint(location, 'in_flight')
+        
+        businesses = self._scrape_location_with_driver(category_formatted, location, driver, instance_id)
+        
+        # Check if we got any businesses with phone numbers
+        businesses_with_phones = [b for b in businesses if b.get('phone')]
+        if not businesses_with_phones:
+            if businesses:
+                print(f"  ⚠️  [Instance {instance_id}] Found {len(businesses)} businesses in {location['city']}, {location['state']} but no phone numbers")
+            self._record_location_scan(location, len(businesses), 0)
+            self._checkpoint(location, 'done')
+            return
+        
+        # Add location info
+        for business in businesses_with_phones:
+            business['city'] = location.get('city', 'Unknown')
+            business['state'] = location.get('state', 'Unknown')
+            business['zip_code'] = location.get('zip', 'Unknown')
+        
+        # Hand the page to the database writer; this only blocks if it falls behind
+        self.writer.submit(
+            businesses_with_phones,
+            self._page_saved_callback(businesses_with_phones, location, instance_id),
+            self._page_failed_callback(location)
+        )
+    
+    def _page_saved_callback(self, businesses: List[Dict], location: Dict, instance_id: int):
+        """Build the callback the writer runs once a page has been committed"""
+        page_phones = len({b['phone'] for b in businesses})
+        
+        def on_saved(new_phones: List[str]):
+            new_count = len(new_phones)
+            with self.stats_lock:
+                self.stats['new_businesses'] += new_count
+                self.stats['existing_businesses'] += page_phones - new_count
+                # Update instance stats
+                self.instance_stats[instance_id]['new_businesses'] += new_count
+            
+            if new_count > 0:
+                print(f"  ✨ [Instance {instance_id}] Found {new_count} new businesses in {location['city']}, {location['state']}")
+            
+            self._record_location_scan(location, page_phones, new_count)
+            # Only count the location as done once its page is committed
+            self._checkpoint(location, 'done')
+        
+        return on_saved
+    
+    def _page_failed_callback(self, location: Dict):
+        """Build the callback the writer runs if a page could not be saved"""
+        def on_failed(error: Exception):
+            # Marked failed rather than left in flight, so it is not mistaken for done
+            self._record_location_failure(location)
+            self._checkpoint(location, 'failed', f"Could not save results: {error}")
+        
+        return on_failed
+    
+    def _record_location_scan(self, location: Dict, results: int, new_count: int):
+        """Feed a finished location into the revisit scheduler's history"""
+        if self.scheduler:
+            try:
+                self.scheduler.record_scan(location, results, new_count)
+            except Exception as e:
+                print(f"  ⚠️  Could not save scan history for {location['city']}: {e}")
+    
+    def _record_location_failure(self, location: Dict):
+        """Back off a location whose scan failed so it is not due again at once"""
+        if self.scheduler:
+            try:
+                self.scheduler.record_failure(location)
+            except Exception as e:
+                print(f"  ⚠️  Could not save scan history for {location['city']}: {e}")
+    
     def _display_progress(self):
         """Display real-time progress of all instances"""
         while True:
@@ -300,22 +611,29 @@ class MapLeadsScraper:
         self.driver = self.setup_driver(0)
         if not self.driver:
             raise Exception("Failed to setup Chrome driver")
+        self.instance_stats[0] = self._new_instance_stats()
         
         try:
             category = monitoring_config['category']
             locations_config = monitoring_config['locations']
             
             # Get all locations
-            all_locations = self.db.get_locations_for_filters(
-                states=locations_config.get('states'),
-                cities=locations_config.get('cities'),
-                min_population=locations_config.get('min_population', 0)
-            )
+            all_locations = self._get_search_locations(monitoring_config)
             
             if not all_locations:
                 print("No locations found matching criteria")
                 return
             
+            self._load_phone_index()
+            self.scheduler = RevisitScheduler.from_config(self.db, monitoring_config)
+            
+            # Continue an interrupted baseline instead of starting over
+            resumed = self._resume_cycle('baseline', monitoring_config, all_locations)
+            if resumed:
+                all_locations = resumed
+            else:
+                self._start_cycle('baseline', monitoring_config, all_locations)
+            
             total_locations = len(all_locations)
             
             # Calculate time estimation
@@ -350,51 +668,47 @@ class MapLeadsScraper:
             
             # Process all locations
             for idx, location in enumerate(all_locations, 1):
-                url = (
-                    f"https://www.google.com/maps/search/{category_formatted}/@"
-                    f"{location['lat']},{location['lng']},13z"
-                )
-                
                 # Progress indicator
                 progress_pct = (idx / total_locations) * 100
                 print(f"Progress: {progress_pct:.1f}% - Scanning {location['city']}, {location['state']} ({idx}/{total_locations})")
                 
+                self._checkpoint(location, 'in_flight')
                 try:
-                    businesses = self._scrape_url(url)
-                    found_count = 0
+                    businesses = self._scrape_location_with_driver(category_formatted, location, self.driver, 0)
+                    businesses = [b for b in businesses if b.get('phone')]
                     
                     # Process all businesses (no "new" vs "existing" in baseline mode)
                     for business in businesses:
-                        if not business.get('phone'):
-                            continue
-                        
                         # Add location info
                         business['city'] = location.get('city', 'Unknown')
                         business['state'] = location.get('state', 'Unknown')
                         business['zip_code'] = location.get('zip', 'Unknown')
-                        
-                        # In baseline mode, add all businesses regardless of existence
-                        if not self.db.business_exists(business['phone']):
-                            self.db.add_business(business)
-                            found_count += 1
-                        else:
-                            # Update last seen for existing businesses
-                            self.db.update_last_seen(business['phone'])
+                    
+                    # In baseline mode, add all businesses and refresh last_seen on known ones
+                    found_count = len(self.db.upsert_businesses(businesses, self.phone_index))
+                    self._record_location_scan(location, len(businesses), found_count)
+                    self._checkpoint(location, 'done')
                     
                     if found_count > 0:
                         print(f"   📋 Added {found_count} businesses from {location['city']}, {location['state']}")
                     
                 except Exception as e:
                     print(f"   ❌ Error processing {location['city']}: {e}")
+                    self._record_location_failure(location)
+                    self._checkpoint(location, 'failed', str(e))
                 
                 # Delay between requests
-                time.sleep(random.uniform(1, 3))
+                time.sleep(random.uniform(*self.request_delay))
             
-            # Baseline completed
+            # Baseline completed, unless locations are left for a resumed run
+            baseline_closed = self._complete_cycle()
             duration = datetime.now() - baseline_start
             duration_minutes = duration.total_seconds() / 60
             
-            print(f"\n✅ Baseline scan completed!")
+            if baseline_closed:
+                print(f"\n✅ Baseline scan completed!")
+            else:
+                print(f"\n⚠️  Baseline scan incomplete, run it again to retry the remaining locations")
             print(f"   Duration: {duration_minutes:.1f} minutes")
             print(f"   Total businesses found: {self.stats['businesses_found']}")
             print(f"   Locations processed: {total_locations}")
@@ -418,6 +732,7 @@ class MapLeadsScraper:
             
         except KeyboardInterrupt:
             print("\n⏹️  Baseline scan stopped by user.")
+            self._save_progress()
         finally:
             self.cleanup()
     
@@ -446,15 +761,16 @@ class MapLeadsScraper:
                 return f"{hours} hours"
     
     def _save_progress(self):
-        """Save current progress to resume later"""
-        progress_data = {
-            'position': self.current_position,
-            'stats': self.stats,
-            'timestamp': datetime.now().isoformat()
-        }
-        # Could save to file or database
-        # For now, just log it
-        print(f"Progress saved at location {self.current_position['location_idx']}")
+        """Report the checkpoint an interrupted scan will resume from"""
+        if self.cycle_id is None:
+            return
+        
+        # Each location's status is already stored as it finishes, so the
+        # checkpoint only needs reporting here
+        progress = self.db.get_scan_cycle_progress(self.cycle_id)
+        remaining = sum(count for status, count in progress.items() if status != 'done')
+        print(f"Progress saved: {progress.get('done', 0)} locations done, {remaining} remaining")
+        print("Run the same command again to resume where you left off")
     
     def _scrape_url(self, url: str) -> List[Dict]:
         """Scrape a single Google Maps URL (legacy single driver method)"""
@@ -463,6 +779,7 @@ class MapLeadsScraper:
     def _scrape_url_with_driver(self, url: str, driver: webdriver.Chrome, instance_id: int) -> List[Dict]:
         """Scrape a single Google Maps URL with a specific driver"""
         businesses = []
+        self.instance_stats[instance_id]['last_card_count'] = 0
         
         try:
             driver.get(url)
@@ -470,28 +787,27 @@ class MapLeadsScraper:
                 self.stats['urls_processed'] += 1
             self.instance_stats[instance_id]['urls_processed'] += 1
             
-            # Wait for initial load
-            time.sleep(3)
-            
-            # Start auto-scrolling
-            driver.execute_script(JS_SCROLL_SCRIPT)
-            
-            # Wait for results
-            max_wait = 20
-            for _ in range(max_wait):
-                time.sleep(1)
-                if "the end of the list" in driver.page_source.lower():
-                    break
+            self._wait_for_results(driver)
             
             # Extract business cards
-            cards = driver.find_elements(
-                By.XPATH, 
-                '//div[contains(@jsaction, "mouseover")]'
-            )
+            if self.card_extraction == 'javascript':
+                cards = driver.execute_script(JS_EXTRACT_CARDS, CARD_XPATH) or []
+                parse_card = self._parse_card_data
+            else:
+                cards = driver.find_elements(By.XPATH, CARD_XPATH)
+                parse_card = self._parse_business_card
+            self.instance_stats[instance_id]['last_card_count'] = len(cards)
+            
+            if self.recorder is not None:
+                if self.card_extraction != 'javascript':
+                    cards_data = driver.execute_script(JS_EXTRACT_CARDS, CARD_XPATH) or []
+                else:
+                    cards_data = cards
+                self.recorder.save(url, driver.page_source, cards_data)
             
             for card in cards:
                 try:
-                    business = self._parse_business_card(card, url)
+                    business = parse_card(card, url)
                     if business:
                         businesses.append(business)
                         with self.stats_lock:
@@ -502,13 +818,53 @@ class MapLeadsScraper:
             
         except Exception as e:
             print(f"[Instance {instance_id}] Error scraping {url}: {e}")
+            # Let the caller retry the location on another attempt
+            raise
         
         return businesses
     
+    def _wait_for_results(self, driver: webdriver.Chrome) -> str:
+        """Wait until the results list is fully loaded, scrolling it as it grows
+        
+        Returns why waiting stopped: 'end', 'idle', 'timeout' or 'no-feed'
+        (single-place and empty searches have no results list).
+        """
+        try:
+            WebDriverWait(driver, self.feed_timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, RESULTS_FEED_SELECTOR))
+            )
+        except TimeoutException:
+            return 'no-feed'
+        
+        driver.set_script_timeout(self.results_timeout + 5)
+        return driver.execute_async_script(
+            JS_WAIT_FOR_RESULTS,
+            RESULTS_FEED_SELECTOR,
+            int(self.results_timeout * 1000),
+            int(self.results_idle_timeout * 1000)
+        )
+    
     def _parse_business_card(self, card, source_url: str) -> Optional[Dict]:
         """Parse a business card element"""
         try:
-            card_text = card.text
+            # Try to get website
+            website = None
+            try:
+                website_div = card.find_element(By.XPATH, ".//div[contains(text(), 'Website')]")
+                parent_div = website_div.find_element(By.XPATH, '..')
+                website = parent_div.get_attribute('href')
+            except NoSuchElementException:
+                pass
+            
+            return self._parse_card_data({'text': card.text, 'website': website}, source_url)
+        
+        except Exception as e:
+            return None
+    
+    def _parse_card_data(self, card_data: Dict, source_url: str) -> Optional[Dict]:
+        """Parse a card's extracted fields (text, website, place_url) into a business"""
+        try:
+            card_text = card_data.get('text') or ''
             
             # Extract phone number
             phone_match = re.search(r'\(?\d{3}\)?[\s-]?\d{3}[\s-]?\d{4}', card_text)
@@ -536,30 +892,25 @@ class MapLeadsScraper:
             if rating_match:
                 rating = float(rating_match.group(1))
             
-            # Try to get website
-            website = None
-            try:
-                website_div = card.find_element(By.XPATH, ".//div[contains(text(), 'Website')]")
-                parent_div = website_div.find_element(By.XPATH, '..')
-                website = parent_div.get_attribute('href')
-            except NoSuchElementException:
-                pass
-            
             # Extract location from URL
             location_data = self._extract_location_from_url(source_url)
             
+            metadata = {
+                'scraped_at': datetime.now().isoformat()
+            }
+            if card_data.get('place_url'):
+                metadata['place_url'] = card_data['place_url']
+            
             return {
                 'name': name,
                 'phone': phone,
                 'category': category,
                 'reviews': reviews,
                 'rating': rating,
-                'website': website,
+                'website': card_data.get('website'),
                 'source_url': source_url,
                 **location_data,
-                'metadata': {
-                    'scraped_at': datetime.now().isoformat()
-                }
+                'metadata': metadata
             }
             
         except Exception as e:
@@ -582,8 +933,28 @@ class MapLeadsScraper:
             'longitude': None
         }
     
+    def request_stop(self):
+        """Ask a running scan to stop after the locations in progress
+        
+        Safe to call from another thread; the scanning thread finishes its
+        current pages and runs cleanup() itself.
+        """
+        self.stop_requested.set()
+    
     def cleanup(self):
         """Clean up resources"""
+        # Save anything still queued for the database
+        if self.writer:
+            self.writer.stop()
+            self.writer = None
+        
+        if self.replay_server:
+            self.replay_server.stop()
+            self.replay_server = None
+        
+        if self.recorder:
+            self.recorder.close()
+        
         # Clean up single driver (for backward compatibility)
         if self.driver:
             self.driver.quit()
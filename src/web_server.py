@@ -3,6 +3,7 @@ Web server for MapLeads UI
 Provides REST API endpoints for the Vue.js frontend
 """
 
+import itertools
 import json
 import threading
 import time
@@ -20,7 +21,6 @@ except ImportError as e:
 
 from .config_manager import ConfigManager
 from .database import Database
-from .scraper_continuous import MapLeadsScraper
 
 # Get absolute path to UI directory
 CURRENT_DIR = Path(__file__).parent
@@ -81,19 +81,33 @@ def get_businesses():
         db = Database()
         
         # Get query parameters
-        limit = request.args.get('limit', 100, type=int)
-        offset = request.args.get('offset', 0, type=int)
+        limit = min(max(request.args.get('limit', 100, type=int), 1), 1000)
+        offset = max(request.args.get('offset', 0, type=int), 0)  # Deprecated, use cursor
+        cursor = request.args.get('cursor') or None
         days = request.args.get('days', None, type=int)
+        filters = {
+            'category': request.args.get('category') or None,
+            'state': request.args.get('state') or None,
+            'city': request.args.get('city') or None,
+            'min_rating': request.args.get('min_rating', None, type=float),
+            'max_rating': request.args.get('max_rating', None, type=float),
+            'has_website': _parse_bool(request.args.get('has_website')),
+            'search': request.args.get('q') or None,
+        }
+        sort = request.args.get('sort') or 'newest'
+        active_filters = {key: value for key, value in filters.items() if value is not None}
         
-        print(f"📊 API request: limit={limit}, offset={offset}, days={days}")
+        print(f"📊 API request: limit={limit}, cursor={cursor}, offset={offset}, days={days}, "
+              f"sort={sort}, filters={active_filters}")
         
-        if days:
-            businesses = db.get_businesses_since_days(days)
-            print(f"📊 Found {len(businesses)} businesses in last {days} days")
-        else:
-            # Get recent businesses with pagination
-            businesses = db.get_recent_businesses(limit, offset)
-            print(f"📊 Found {len(businesses)} recent businesses (limit={limit}, offset={offset})")
+        # Offset clients get the same sorted query as cursor clients, so
+        # their pages line up with any cursor pages that follow
+        try:
+            businesses, next_cursor = db.get_businesses_page(limit, cursor, days, sort=sort,
+                                                             offset=offset, **filters)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        print(f"📊 Found {len(businesses)} businesses (limit={limit}, days={days})")
         
         # Convert datetime objects to strings for JSON serialization
         for business in businesses:
@@ -103,13 +117,37 @@ def get_businesses():
                 business['last_updated'] = business['last_updated'].isoformat()
         
         print(f"📊 Returning {len(businesses)} businesses to frontend")
-        return jsonify({'success': True, 'businesses': businesses})
+        return jsonify({'success': True, 'businesses': businesses, 'next_cursor': next_cursor})
     except Exception as e:
         print(f"❌ API error: {e}")
         import traceback
         traceback.print_exc()
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@app.route('/api/businesses/filters', methods=['GET'])
+def get_business_filters():
+    """Get the categories and states available for filtering, with counts"""
+    try:
+        db = Database()
+        return jsonify({
+            'success': True,
+            'categories': db.get_category_counts(),
+            'states': db.get_state_counts()
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+def _parse_bool(value):
+    """Parse a true/false query parameter; None when absent or unrecognized"""
+    if value is None:
+        return None
+    value = value.strip().lower()
+    if value in ('1', 'true', 'yes'):
+        return True
+    if value in ('0', 'false', 'no'):
+        return False
+    return None
+
 @app.route('/api/statistics', methods=['GET'])
 def get_statistics():
     """Get database statistics"""
@@ -139,6 +177,8 @@ def start_scraper():
             global scraper_instance, scraper_running
             try:
                 scraper_running = True
+                # Selenium is only loaded once a scan is actually started
+                from .scraper_continuous import MapLeadsScraper
                 db = Database()
                 scraper_instance = MapLeadsScraper(db, headless=True)
                 scraper_instance.continuous_scan(config['monitoring'])
@@ -165,11 +205,12 @@ def stop_scraper():
         if not scraper_running:
             return jsonify({'success': False, 'error': 'Scraper is not running'})
         
-        scraper_running = False
+        # The scan thread cleans up once it sees the request; tearing the
+        # writer and browsers down from here would pull them from under it
         if scraper_instance:
-            scraper_instance.cleanup()
+            scraper_instance.request_stop()
         
-        return jsonify({'success': True, 'message': 'Scraper stopped successfully'})
+        return jsonify({'success': True, 'message': 'Scraper is stopping'})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -197,9 +238,11 @@ def export_data():
         days = data.get('days', 30)
         
         db = Database()
-        businesses = db.get_businesses_since_days(days)
+        businesses = db.iter_businesses_since_days(days)
         
-        if not businesses:
+        # Peek at the first row so an empty export doesn't create a file
+        first = next(businesses, None)
+        if first is None:
             return jsonify({'success': False, 'error': f'No businesses found in the last {days} days'})
         
         from datetime import datetime
@@ -207,13 +250,13 @@ def export_data():
         filename = f"mapleads_export_{timestamp}.{format_type}"
         
         from .exporter import export_businesses
-        export_businesses(businesses, filename, format_type)
+        count = export_businesses(itertools.chain([first], businesses), filename, format_type)
         
         return jsonify({
             'success': True, 
-            'message': f'Exported {len(businesses)} businesses to {filename}',
+            'message': f'Exported {count} businesses to {filename}',
             'filename': filename,
-            'count': len(businesses)
+            'count': count
         })
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -34,6 +34,22 @@ createApp({
             },
             statistics: {},
             businesses: [],
+            businessCursor: null,
+            loadingMore: false,
+            businessFilters: {
+                q: '',
+                category: '',
+                state: '',
+                city: '',
+                min_rating: '',
+                has_website: '',
+                sort: 'newest'
+            },
+            businessFilterOptions: {
+                categories: {},
+                states: {}
+            },
+            searchTimer: null,
             recentBusinesses: [],
             scraperStatus: {
                 running: false,
@@ -78,6 +94,7 @@ createApp({
         setView(view) {
             this.currentView = view
             if (view === 'businesses') {
+                this.loadBusinessFilterOptions()
                 this.loadBusinesses()
             }
         },
@@ -200,18 +217,64 @@ createApp({
             }
         },
         
+        businessesUrl(cursor) {
+            let url = `/api/businesses?limit=${this.businessLimit}`
+            if (this.businessDays) {
+                url += `&days=${this.businessDays}`
+            }
+            for (const [key, value] of Object.entries(this.businessFilters)) {
+                if (value !== '' && value !== null) {
+                    url += `&${key}=${encodeURIComponent(value)}`
+                }
+            }
+            if (cursor) {
+                url += `&cursor=${encodeURIComponent(cursor)}`
+            }
+            return url
+        },
+        
+        async loadBusinessFilterOptions() {
+            try {
+                const response = await fetch('/api/businesses/filters')
+                const data = await response.json()
+                if (data.success) {
+                    this.businessFilterOptions = {
+                        categories: data.categories,
+                        states: data.states
+                    }
+                }
+            } catch (error) {
+                console.error('Error loading business filters:', error)
+            }
+        },
+        
+        onBusinessSearch() {
+            // Wait for a pause in typing before querying the server
+            clearTimeout(this.searchTimer)
+            this.searchTimer = setTimeout(this.loadBusinesses, 300)
+        },
+        
+        clearBusinessFilters() {
+            this.businessFilters = {
+                q: '',
+                category: '',
+                state: '',
+                city: '',
+                min_rating: '',
+                has_website: '',
+                sort: 'newest'
+            }
+            this.loadBusinesses()
+        },
+        
         async loadBusinesses() {
             this.loading = true
             try {
-                let url = `/api/businesses?limit=${this.businessLimit}`
-                if (this.businessDays) {
-                    url += `&days=${this.businessDays}`
-                }
-                
-                const response = await fetch(url)
+                const response = await fetch(this.businessesUrl(null))
                 const data = await response.json()
                 if (data.success) {
                     this.businesses = data.businesses
+                    this.businessCursor = data.next_cursor
                 }
             } catch (error) {
                 this.showToast('Error loading businesses', 'error')
@@ -220,6 +283,23 @@ createApp({
             }
         },
         
+        async loadMoreBusinesses() {
+            if (!this.businessCursor || this.loadingMore) return
+            this.loadingMore = true
+            try {
+                const response = await fetch(this.businessesUrl(this.businessCursor))
+                const data = await response.json()
+                if (data.success) {
+                    this.businesses = this.businesses.concat(data.businesses)
+                    this.businessCursor = data.next_cursor
+                }
+            } catch (error) {
+                this.showToast('Error loading businesses', 'error')
+            } finally {
+                this.loadingMore = false
+            }
+        },
+        
         async loadRecentBusinesses() {
             try {
                 const response = await fetch('/api/businesses?limit=6')
@@ -293,7 +373,7 @@ createApp({
                 const response = await fetch('/api/scraper/stop', { method: 'POST' })
                 const data = await response.json()
                 if (data.success) {
-                    this.showToast('Scraper stopped successfully!', 'success')
+                    this.showToast('Scraper is stopping...', 'success')
                     setTimeout(() => this.checkScraperStatus(), 1000)
                 } else {
                     this.showToast(data.error || 'Failed to stop scraper', 'error')